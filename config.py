@@ -6,8 +6,17 @@ Handles loading and managing configuration settings
 import os
 import json
 import logging
+import threading
+import time
+from functools import cached_property
 from pathlib import Path
 
+try:
+    from inotify_simple import INotify, flags
+except ImportError:
+    # inotify is Linux-only; without it the config is read once at startup
+    INotify = None
+
 logger = logging.getLogger(__name__)
 
 class Config:
@@ -20,6 +29,9 @@ class Config:
         """
         self.config_file = config_file
         self.config_data = {}
+        self._dirty = False
+        self._pending = {}  # Values set() since the last save, kept across file reloads
+        self._lock = threading.Lock()
         
         # Default configuration
         self.defaults = {
@@ -30,32 +42,97 @@ class Config:
             "update_interval": 30,  # minutes
             "display_rotation": 0,
             "language": "de",
-            "units": "metric"
+            "units": "metric",
+            "fast_spi": False  # 10 MHz panel SPI clock; enable only once verified on the panel
         }
         
         self.load_config()
+        self._start_watcher()
+    
+    def _start_watcher(self):
+        """Reload the configuration whenever the file is rewritten (Linux only)"""
+        if INotify is None:
+            logger.debug("inotify_simple not available, config file will not be watched")
+            return
+        
+        try:
+            self._inotify = INotify()
+            watch_dir = os.path.dirname(os.path.abspath(self.config_file))
+            self._inotify.add_watch(watch_dir, flags.CLOSE_WRITE | flags.MOVED_TO)
+        except Exception as e:
+            logger.warning(f"Could not watch configuration file: {e}")
+            return
+        
+        threading.Thread(target=self._watch_loop, daemon=True).start()
+    
+    def _watch_loop(self):
+        """Block on inotify events and reload when config_file changes"""
+        config_name = os.path.basename(self.config_file)
+        while True:
+            try:
+                events = self._inotify.read()
+                if any(event.name == config_name for event in events):
+                    logger.info(f"Configuration file {self.config_file} changed, reloading")
+                    self._reload_config()
+            except Exception as e:
+                logger.error(f"Error watching configuration file: {e}")
+                time.sleep(5)  # Avoid spinning if the inotify descriptor keeps failing
+    
+    def _reload_config(self):
+        """Re-read config_file, keeping the current values if it is missing or invalid"""
+        try:
+            with open(self.config_file, 'r', encoding='utf-8') as f:
+                config_data = json.load(f)
+            if not isinstance(config_data, dict):
+                raise ValueError("top level is not a JSON object")
+        except (OSError, ValueError) as e:
+            logger.warning(f"Keeping current configuration, could not reload {self.config_file}: {e}")
+            return
+        
+        with self._lock:
+            # Unsaved set() values win over the file until the next flush
+            config_data.update(self._pending)
+            self.config_data = config_data
+            self._invalidate_cached()
+        logger.info(f"Configuration reloaded from {self.config_file}")
+    
+    def _invalidate_cached(self, key=None):
+        """Drop cached property values so they are re-read (all keys if key is None)"""
+        keys = self.defaults if key is None else (key,)
+        for name in keys:
+            self.__dict__.pop(name, None)
     
     def load_config(self):
         """Load configuration from file or create default"""
         try:
             if os.path.exists(self.config_file):
                 with open(self.config_file, 'r', encoding='utf-8') as f:
-                    self.config_data = json.load(f)
+                    config_data = json.load(f)
+                with self._lock:
+                    self.config_data = config_data
+                    self._invalidate_cached()
                 logger.info(f"Configuration loaded from {self.config_file}")
             else:
                 logger.info("Configuration file not found, creating default")
-                self.config_data = self.defaults.copy()
+                with self._lock:
+                    self.config_data = self.defaults.copy()
+                    self._invalidate_cached()
                 self.save_config()
                 
         except Exception as e:
             logger.error(f"Error loading configuration: {e}")
-            self.config_data = self.defaults.copy()
+            with self._lock:
+                self.config_data = self.defaults.copy()
+                self._invalidate_cached()
     
     def save_config(self):
         """Save current configuration to file"""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config_data, f, indent=4, ensure_ascii=False)
+            with self._lock:
+                with open(self.config_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.config_data, f, indent=4, ensure_ascii=False)
+                self._dirty = False
+                self._pending.clear()
             logger.info(f"Configuration saved to {self.config_file}")
         except Exception as e:
             logger.error(f"Error saving configuration: {e}")
@@ -65,46 +142,59 @@ class Config:
         return self.config_data.get(key, default)
     
     def set(self, key, value):
-        """Set configuration value"""
-        self.config_data[key] = value
-        self.save_config()
+        """Set configuration value (persisted on the next flush)"""
+        with self._lock:
+            self.config_data[key] = value
+            self._pending[key] = value
+            self._dirty = True
+            self._invalidate_cached(key)
+    
+    def flush(self):
+        """Write configuration to file if it changed since the last save"""
+        if self._dirty:
+            self.save_config()
     
-    @property
+    @cached_property
     def latitude(self):
         """Get latitude coordinate"""
-        return self.config_data.get('latitude', 54.3091)
+        return self.config_data.get('latitude', self.defaults['latitude'])
     
-    @property
+    @cached_property
     def longitude(self):
         """Get longitude coordinate"""
-        return self.config_data.get('longitude', 13.0818)
+        return self.config_data.get('longitude', self.defaults['longitude'])
     
-    @property
+    @cached_property
     def city(self):
         """Get city name"""
-        return self.config_data.get('city', 'Stralsund')
+        return self.config_data.get('city', self.defaults['city'])
     
-    @property
+    @cached_property
     def country_code(self):
         """Get country code"""
-        return self.config_data.get('country_code', 'DE')
+        return self.config_data.get('country_code', self.defaults['country_code'])
     
-    @property
+    @cached_property
     def update_interval(self):
         """Get update interval in minutes"""
-        return self.config_data.get('update_interval', 30)
+        return self.config_data.get('update_interval', self.defaults['update_interval'])
     
-    @property
+    @cached_property
     def display_rotation(self):
         """Get display rotation"""
-        return self.config_data.get('display_rotation', 0)
+        return self.config_data.get('display_rotation', self.defaults['display_rotation'])
     
-    @property
+    @cached_property
     def language(self):
         """Get language code"""
-        return self.config_data.get('language', 'de')
+        return self.config_data.get('language', self.defaults['language'])
     
-    @property
+    @cached_property
     def units(self):
         """Get units (metric/imperial)"""
-        return self.config_data.get('units', 'metric')
+        return self.config_data.get('units', self.defaults['units'])
+    
+    @cached_property
+    def fast_spi(self):
+        """Get whether the panel SPI clock is raised above the vendor 4 MHz"""
+        return self.config_data.get('fast_spi', self.defaults['fast_spi'])
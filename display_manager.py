@@ -6,69 +6,236 @@ Handles the e-ink display rendering, layout, and icon processing
 import os
 import time
 import logging
+import hashlib
 import json
-import math
-from datetime import datetime, timedelta
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont, ImageOps
-from datetime import datetime
 import os
 import sys
-import glob
 
 # PNG icons are used - no Cairo/SVG dependencies needed!
 
+# Directory of this module; data files are resolved against it once at import
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
 # Add the waveshare_epd directory to the path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'waveshare_epd'))
+sys.path.append(os.path.join(_BASE_DIR, 'waveshare_epd'))
 
 try:
-    from waveshare_epd import epd2in13_V4
+    from waveshare_epd import epd2in13_V4 as epd_driver
 except ImportError:
     # Fallback for development/testing without hardware
-    epd2in13_V4 = None
+    epd_driver = None
 
 logger = logging.getLogger(__name__)
 
+# Lato fonts directory
+FONTS_DIR = os.path.join(_BASE_DIR, 'Lato')
+
+# Map weight names to font files (Lato naming convention)
+_FONT_WEIGHTS = {
+    'light': 'Light',
+    'regular': 'Regular',
+    'medium': 'Regular',  # Lato doesn't have Medium, use Regular
+    'semibold': 'Bold',   # Lato doesn't have SemiBold, use Bold
+    'bold': 'Bold',
+    'extrabold': 'Black'  # Lato uses Black for extra bold
+}
+
+# Boot config checked for the SPI overlay, and a marker recording a passed check;
+# the marker is trusted while it is newer than the boot config
+BOOT_CONFIG_FILE = '/boot/config.txt'
+SPI_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'weatherstation', 'spi_verified')
+
+# Layout constants for the 250x122 landscape panel
+DISPLAY_WIDTH = 250
+DISPLAY_HEIGHT = 122
+MARGIN = 8  # Increased margin to move content away from corners
+HEADER_HEIGHT = 24  # Increased for bigger time font
+CONTENT_Y = HEADER_HEIGHT + 3
+TEMP_Y = CONTENT_Y + 24  # More space from city name
+ICON_SIZE = 50
+ICON_X = DISPLAY_WIDTH - ICON_SIZE - MARGIN
+ICON_Y = max(HEADER_HEIGHT + 2, (DISPLAY_HEIGHT - ICON_SIZE) // 2)  # Centered vertically on the right
+
+# Partial refreshes between full refreshes (full refreshes clear e-ink ghosting)
+PARTIAL_REFRESH_LIMIT = 10
+
+# SPI clock used with fast_spi (opt-in, above the vendor 4 MHz); the 4000-byte frame upload is bandwidth bound
+FAST_SPI_SPEED_HZ = 10000000
+
+# Unit vectors of the sun icon rays, one every 30 degrees
+_SUN_RAY_ANGLES = np.radians(np.arange(0, 360, 30))
+_SUN_RAY_DIRECTIONS = np.stack([np.cos(_SUN_RAY_ANGLES), np.sin(_SUN_RAY_ANGLES)], axis=1)
+
+# Pre-rendered 1-bit icon buffers keyed by (icon_type, icon_size)
+_ICON_CACHE = {}
+
+
+def _icon_type(weather_code):
+    """Map a WMO weather code to the programmatic icon drawn for it"""
+    if weather_code == 0:
+        return 'clear'
+    if weather_code in (1, 2):
+        return 'partly_cloudy'
+    if weather_code in (3, 45, 48):
+        return 'cloudy'
+    if weather_code in (51, 53, 55, 61, 63, 65, 80, 81, 82):
+        return 'rain'
+    if weather_code in (71, 73, 75, 77, 85, 86):
+        return 'snow'
+    if weather_code in (95, 96, 99):
+        return 'thunderstorm'
+    return 'unknown'
+
+
+@lru_cache(maxsize=1)
+def _boot_config_enables_spi():
+    """Whether /boot/config.txt enables SPI, ignoring commented-out lines (None if unreadable)"""
+    try:
+        with open(BOOT_CONFIG_FILE, 'r') as f:
+            # Stop at the first match instead of reading the whole file
+            return any(line.lstrip().startswith('dtparam=spi=on') for line in f)
+    except FileNotFoundError:
+        logger.warning("Could not verify /boot/config.txt (may not be on Raspberry Pi)")
+    except PermissionError:
+        logger.warning("Permission denied reading /boot/config.txt")
+    return None
+
+
+@lru_cache(maxsize=1)
+def _time_strings(minute_epoch):
+    """Format the (short weekday, date, time) header strings for a minute since the epoch"""
+    weekday, current_date, current_time = time.strftime("%A|%d.%m.%Y|%H:%M", time.localtime(minute_epoch * 60)).split("|")
+    return weekday[:2].upper(), current_date, current_time
+
+
+def _readahead(path):
+    """Ask the kernel to page a file in ahead of FreeType's scattered reads (Linux only)"""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        logger.debug(f"Readahead of {path} failed: {e}")
+
+
+@lru_cache(maxsize=None)
+def _resolve_font_path(weight, italic):
+    """Find the first installed font file for a weight/style (probed once per combination)"""
+    # Build font filename (Lato naming convention)
+    weight_name = _FONT_WEIGHTS.get(weight.lower(), 'Regular')
+    italic_suffix = 'Italic' if italic else ''
+    font_filename = f"Lato-{weight_name}{italic_suffix}.ttf"
+    
+    # Try Lato fonts first
+    lato_paths = [
+        os.path.join(FONTS_DIR, font_filename),
+        # Alternative paths for Lato
+        os.path.join(FONTS_DIR, 'static', font_filename),
+        os.path.join(FONTS_DIR, f'Lato-Regular.ttf')  # Fallback to Regular
+    ]
+    
+    # System font fallbacks
+    system_font_paths = [
+        # Linux fonts (Raspberry Pi)
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf" if weight in ['bold', 'semibold', 'extrabold'] else "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+        "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf" if weight in ['bold', 'semibold', 'extrabold'] else "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
+        # macOS fonts
+        "/System/Library/Fonts/Helvetica.ttc",
+        "/System/Library/Fonts/Arial.ttf",
+    ]
+    
+    for font_path in lato_paths + system_font_paths:
+        if os.path.isfile(font_path):
+            _readahead(font_path)
+            return font_path
+    
+    logger.warning(f"No font file found for weight '{weight}', using Pillow default font")
+    return None
+
+
+@lru_cache(maxsize=64)
+def _load_font(font_path, size):
+    """Load a font file at a size (shared by all instances and weights that map to the same file)"""
+    if font_path is None:
+        # Final fallback to default font
+        return ImageFont.load_default()
+    return ImageFont.truetype(font_path, size)
+
+
 class DisplayManager:
-    def __init__(self):
-        """Initialize the display manager"""
+    # Text drawn per frame: (x, y, font key, fill, field); fill 0 = black, 255 = white
+    _TEXT_LAYOUT = (
+        (MARGIN, 3, 'small', 255, 'date'),                      # Date in header
+        (MARGIN, CONTENT_Y, 'title', 0, 'city'),                # City name (no underline)
+        (MARGIN, TEMP_Y, 'temp', 0, 'temperature'),             # Large and prominent
+        (MARGIN, TEMP_Y + 38, 'medium', 0, 'description'),      # Below temperature
+    )
+    # Fields that change at most daily, kept in the prerendered static layer
+    _STATIC_FIELDS = ('date', 'city')
+    # Result of the SPI verification, computed once per process
+    _SPI_VERIFIED = None
+    
+    def __init__(self, partial_refresh=True, fast_spi=False):
+        """Initialize the display manager (partial_refresh=False for conservative panel timing;
+        fast_spi=True raises the SPI clock once the panel is verified to tolerate it)"""
         # Use landscape orientation like working Pwnagotchi code (250x122)
-        self.width = 250
-        self.height = 122
+        self.width = DISPLAY_WIDTH
+        self.height = DISPLAY_HEIGHT
         self.epd = None
+        self._last_sig = None  # Signature of the last displayed frame
+        self._last_buffer_hash = None  # Hash of the last framebuffer sent to the panel
         
-        # Set up icons directory (Visual Crossing Weather Icons - 3rd Set)
-        base_dir = os.path.dirname(__file__)
-        candidate_icon_dirs = [
-            os.path.join(base_dir, 'visual_crossing_icons'),
-            os.path.join(base_dir, '3rd Set - Monochrome')
-        ]
-
-        self.icons_dir = None
-        for icon_dir in candidate_icon_dirs:
-            if os.path.isdir(icon_dir):
-                self.icons_dir = icon_dir
-                break
-
-        if not self.icons_dir:
-            # Default to the first directory and warn when icons are missing
-            self.icons_dir = candidate_icon_dirs[0]
-            logger.warning(
-                "No weather icon directory found. Expected one of: %s", candidate_icon_dirs
-            )
-
-        self.icon_cache = {}  # Cache for loaded icons
+        # Preallocated panel framebuffer (portrait rows of 122 px, 1 bit per pixel)
+        self._fb = bytearray(((self.height + 7) // 8) * self.width)
+        self._fb_rows = np.frombuffer(self._fb, dtype=np.uint8).reshape(self.width, -1)  # Writable row view
         
         # Set up fonts directory (Lato fonts)
-        self.fonts_dir = os.path.join(os.path.dirname(__file__), 'Lato')
-        self.font_cache = {}  # Cache for loaded fonts
+        self.fonts_dir = FONTS_DIR
+        
+        # Font bundle used by create_weather_image (Lato hierarchy - SMALLER SIZES)
+        self._font_title = self.get_font(16, weight='semibold')    # 18 → 16 (-2)
+        self._font_temp = self.get_font(34, weight='bold')         # 38 → 34 (-4)
+        self._font_medium = self.get_font(14, weight='medium')     # 16 → 14 (-2)
+        self._font_small = self.get_font(12, weight='regular')     # 14 → 12 (-2)
+        self._font_time = self.get_font(16, weight='bold')         # Bigger and bold for prominence
+        self._fonts = {
+            'title': self._font_title,
+            'temp': self._font_temp,
+            'medium': self._font_medium,
+            'small': self._font_small,
+        }
+        
+        # Static chrome, clock glyphs and programmatic icons, rendered once per process
+        self._icon_images = {}  # Icon images wrapped around _ICON_CACHE buffers
+        self._build_layout()
+        self._static_layer_key = None
+        self._static_layer_image = None
         
-        # Process icons to remove white backgrounds
-        self.process_weather_icons()
+        # Canvas reused by every frame; create_weather_image returns it, so the
+        # image is owned by the manager and only valid until the next call
+        self._canvas = Image.new('1', (self.width, self.height), 255)
+        self._canvas_draw = ImageDraw.Draw(self._canvas)
+        self._last_weather_render = None  # (input key, derived strings and icon type)
         
         # Initialize the e-paper display if available
-        if epd2in13_V4:
+        if epd_driver:
             try:
-                self.epd = epd2in13_V4.EPD()
+                self.epd = epd_driver.EPD()
+                
+                # epd.init() reopens SPI, so set the clock it opens with
+                epdconfig = getattr(epd_driver, 'epdconfig', None)
+                if fast_spi and epdconfig is not None:
+                    epdconfig.SPI_SPEED_HZ = FAST_SPI_SPEED_HZ
                 
                 # Comprehensive SPI verification as per Waveshare documentation
                 if self._verify_spi_setup():
@@ -83,76 +250,217 @@ class DisplayManager:
                 self.epd = None
         else:
             logger.warning("E-paper display module not available (development mode)")
+        
+        # Panel updates run on a worker thread; the 1-slot queue coalesces frames
+        self._frames = queue.Queue(maxsize=1)
+        self._epd_lock = threading.Lock()
+        
+        # Partial refresh needs the B/W driver and a base image set by a full refresh
+        self._supports_partial = partial_refresh and bool(self.epd) and hasattr(self.epd, 'displayPartial')
+        self._partial_updates = None  # Partial refreshes since the last full one (None: no base image)
+        self._panel_buffer = None  # Framebuffer the panel RAM holds (None: unknown)
+        self._asleep = False  # Panel in deep sleep (base image kept in controller RAM)
+        self._last_pixels = None  # Rendered pixels of the last queued frame
+        
+        # Variable layout regions (x0, y0, x1, y1); anything else is static chrome
+        icon_x = ICON_X
+        self._regions = {
+            'header': (0, 0, self.width, HEADER_HEIGHT + 1),
+            'city': (1, HEADER_HEIGHT + 1, icon_x, TEMP_Y),
+            'temperature': (1, TEMP_Y, icon_x, TEMP_Y + 38),
+            'description': (1, TEMP_Y + 38, icon_x, self.height - 1),
+            'icon': (icon_x, HEADER_HEIGHT + 1, self.width - 1, self.height - 1),
+        }
+        if self.epd:
+            self._display_thread = threading.Thread(target=self._display_worker, name='epd-display', daemon=True)
+            self._display_thread.start()
+        else:
+            # Development PNGs are written off the caller's thread; only the newest is kept
+            self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='png-save')
+            self._png_save = None
     
-    def process_weather_icons(self):
-        """Process weather icons to remove white backgrounds"""
-        if not self.icons_dir:
-            return
-            
-        # Process all PNG files in the icons directory
-        for icon_file in glob.glob(os.path.join(self.icons_dir, '*.png')):
+    def _display_worker(self):
+        """Push queued frames to the panel one at a time"""
+        while True:
+            buffer, dirty_regions = self._frames.get()
             try:
-                # Skip already processed icons
-                if icon_file.endswith('_processed.png'):
-                    continue
-                    
-                output_file = icon_file.replace('.png', '_processed.png')
-                
-                # Only process if output doesn't exist
-                if not os.path.exists(output_file):
-                    # Open the image and convert to RGBA if needed
-                    with Image.open(icon_file) as img:
-                        if img.mode != 'RGBA':
-                            img = img.convert('RGBA')
-                        
-                        # Make white pixels transparent and ensure black color
-                        data = img.getdata()
-                        new_data = []
-                        for r, g, b, a in data:
-                            if r > 200 and g > 200 and b > 200:  # White background
-                                new_data.append((0, 0, 0, 0))  # Transparent
-                            else:  # Keep original color but ensure it's black
-                                new_data.append((0, 0, 0, 255))  # Black with full opacity
-                        img.putdata(new_data)
-                        img = img.convert('1')  # Convert to 1-bit black and white
-                        img.save(output_file, 'PNG', transparency=0)  # Save with transparency
-            
+                with self._epd_lock:
+                    self._refresh_panel(buffer, dirty_regions)
+                logger.info("Weather data displayed on e-paper")
             except Exception as e:
-                logger.warning(f"Error processing icon {icon_file}: {e}")
+                logger.error(f"Error displaying weather data: {e}")
+                # Redraw on the next update
+                self._last_sig = None
+                self._last_buffer_hash = None
+                self._last_pixels = None
+                self._partial_updates = None
+                self._panel_buffer = None
+            finally:
+                self._frames.task_done()
+    
+    def _refresh_panel(self, buffer, dirty_regions):
+        """Update the panel, with a fast partial refresh when only variable regions changed"""
+        use_partial = (
+            self._supports_partial
+            and self._partial_updates is not None
+            and self._partial_updates < PARTIAL_REFRESH_LIMIT
+            and dirty_regions is not None
+            and 'chrome' not in dirty_regions
+        )
+        if use_partial:
+            if self._asleep:
+                self._wake_for_partial()
+            rows = self._changed_rows(buffer)
+            if rows is not None and rows[0] > rows[1]:
+                return  # A coalesced frame put the panel content back
+            logger.debug(f"Partial refresh of regions: {sorted(dirty_regions)}")
+            if rows is None:
+                self.epd.displayPartial(buffer)
+            else:
+                # Only the gate lines between the first and last changed row go over SPI
+                first, last = rows
+                row_bytes = self._fb_rows.shape[1]
+                self.epd.displayPartialWindow(buffer[first * row_bytes:(last + 1) * row_bytes], first, last)
+            self._partial_updates += 1
+        elif self._supports_partial:
+            # Full refresh that also loads the base image for later partial updates;
+            # partial mode reprograms the controller, so re-init after partials
+            if self._partial_updates or self._asleep:
+                self.epd.init()
+                self._asleep = False
+            self.epd.displayPartBaseImage(buffer)
+            self._partial_updates = 0
+        else:
+            if self._asleep:
+                self.epd.init()
+                self._asleep = False
+            # Display on e-paper (single image for B/W display)
+            self.epd.display(buffer)
+        self._panel_buffer = buffer
+    
+    def _changed_rows(self, buffer):
+        """(first, last) panel row that differs from the shown frame; None if unknown or unsupported"""
+        if self._panel_buffer is None or not hasattr(self.epd, 'displayPartialWindow'):
+            return None
+        row_bytes = self._fb_rows.shape[1]
+        old = np.frombuffer(self._panel_buffer, dtype=np.uint8).reshape(-1, row_bytes)
+        new = np.frombuffer(buffer, dtype=np.uint8).reshape(-1, row_bytes)
+        changed = np.flatnonzero((old != new).any(axis=1))
+        if not len(changed):
+            return 1, 0  # Empty range: nothing to send
+        return int(changed[0]), int(changed[-1])
+    
+    def _wake_for_partial(self):
+        """Leave deep sleep without the full init; displayPartial resets the controller itself"""
+        epdconfig = getattr(epd_driver, 'epdconfig', None)
+        if epdconfig is None or epdconfig.module_init() != 0:
+            # No access to the bus layer: fall back to a full init
+            self.epd.init()
+            self._panel_buffer = None  # Send the whole frame after the reset
+        self._asleep = False
+    
+    def _dirty_regions(self, rendered):
+        """Names of the layout regions that differ from the last queued frame"""
+        previous, self._last_pixels = self._last_pixels, rendered
+        if previous is None:
+            return None  # Unknown panel content
+        
+        changed = previous != rendered
+        dirty = {name for name, (x0, y0, x1, y1) in self._regions.items()
+                 if changed[y0:y1, x0:x1].any()}
+        for x0, y0, x1, y1 in self._regions.values():
+            changed[y0:y1, x0:x1] = False
+        if changed.any():
+            dirty.add('chrome')
+        return dirty
+    
+    def _queue_frame(self, buffer, dirty_regions):
+        """Hand a frame to the display worker, replacing one that is still waiting"""
+        try:
+            self._frames.put_nowait((buffer, dirty_regions))
+        except queue.Full:
+            dropped = self._drop_pending_frame()
+            # The panel still shows the frame before the dropped one
+            if dropped is not None:
+                dropped_regions = dropped[1]
+                if dropped_regions is None or dirty_regions is None:
+                    dirty_regions = None
+                else:
+                    dirty_regions = dirty_regions | dropped_regions
+            self._frames.put_nowait((buffer, dirty_regions))
+    
+    def _drop_pending_frame(self):
+        """Discard a frame the display worker has not picked up yet and return it"""
+        try:
+            dropped = self._frames.get_nowait()
+            self._frames.task_done()
+            return dropped
+        except queue.Empty:
+            return None
     
     def _verify_spi_setup(self):
-        """Verify SPI setup according to Waveshare documentation"""
-        import glob
-        
-        # Check if SPI devices exist
-        spi_devices = glob.glob('/dev/spidev*')
+        """Verify SPI setup according to Waveshare documentation (once per process)"""
+        if DisplayManager._SPI_VERIFIED is None:
+            if self._spi_check_cached():
+                logger.debug(f"SPI verification cached in {SPI_CACHE_FILE}")
+                DisplayManager._SPI_VERIFIED = True
+            else:
+                DisplayManager._SPI_VERIFIED = self._check_spi_setup()
+                if DisplayManager._SPI_VERIFIED:
+                    self._cache_spi_check()
+        return DisplayManager._SPI_VERIFIED
+    
+    def _spi_check_cached(self):
+        """Whether an earlier run passed the SPI check since the boot config last changed"""
+        try:
+            verified_at = os.path.getmtime(SPI_CACHE_FILE)
+        except OSError:
+            return False
+        try:
+            if os.path.getmtime(BOOT_CONFIG_FILE) > verified_at:
+                return False
+        except OSError:
+            pass
+        return os.path.exists('/dev/spidev0.0')
+    
+    def _cache_spi_check(self):
+        """Record a passed SPI check for later runs"""
+        try:
+            os.makedirs(os.path.dirname(SPI_CACHE_FILE), exist_ok=True)
+            with open(SPI_CACHE_FILE, 'w'):
+                pass
+        except OSError as e:
+            logger.debug(f"Could not cache SPI verification {SPI_CACHE_FILE}: {e}")
+    
+    def _check_spi_setup(self):
+        """Run the SPI device and boot config checks"""
+        # Check if SPI devices exist; one /dev listing doubles as the stat cache
+        try:
+            with os.scandir('/dev') as entries:
+                spi_devices = sorted(f'/dev/{e.name}' for e in entries if e.name.startswith('spidev'))
+        except OSError:
+            spi_devices = []
         if not spi_devices:
             logger.error("No SPI devices found. Enable SPI with: sudo raspi-config")
             return False
+        present = set(spi_devices)
         
         # Check for expected SPI devices (spidev0.0 and spidev0.1)
         expected_devices = ['/dev/spidev0.0', '/dev/spidev0.1']
-        found_devices = [dev for dev in expected_devices if os.path.exists(dev)]
+        found_devices = [dev for dev in expected_devices if dev in present]
         
         if len(found_devices) < 2:
             logger.warning(f"Expected SPI devices: {expected_devices}")
             logger.warning(f"Found SPI devices: {spi_devices}")
             logger.warning("SPI may be partially configured or occupied by other drivers")
         
-        # Check if SPI is enabled in boot config
-        try:
-            with open('/boot/config.txt', 'r') as f:
-                config_content = f.read()
-                if 'dtparam=spi=on' not in config_content:
-                    logger.warning("SPI not enabled in /boot/config.txt. Run: sudo raspi-config")
-                    return False
-        except FileNotFoundError:
-            logger.warning("Could not verify /boot/config.txt (may not be on Raspberry Pi)")
-        except PermissionError:
-            logger.warning("Permission denied reading /boot/config.txt")
+        # Check if SPI is enabled in boot config (ignoring commented-out lines)
+        if _boot_config_enables_spi() is False:
+            logger.warning("SPI not enabled in /boot/config.txt. Run: sudo raspi-config")
+            return False
         
         # At minimum, we need spidev0.0 for the display
-        if os.path.exists('/dev/spidev0.0'):
+        if '/dev/spidev0.0' in present:
             logger.info(f"SPI verification passed. Available devices: {spi_devices}")
             return True
         else:
@@ -161,349 +469,11 @@ class DisplayManager:
     
     def get_font(self, size=12, weight='regular', italic=False):
         """Get Lato font with specified weight and style"""
-        cache_key = f"{size}_{weight}_{italic}"
-        if cache_key in self.font_cache:
-            return self.font_cache[cache_key]
-        
-        # Map weight names to font files (Lato naming convention)
-        weight_mapping = {
-            'light': 'Light',
-            'regular': 'Regular', 
-            'medium': 'Regular',  # Lato doesn't have Medium, use Regular
-            'semibold': 'Bold',   # Lato doesn't have SemiBold, use Bold
-            'bold': 'Bold',
-            'extrabold': 'Black'  # Lato uses Black for extra bold
-        }
-        
-        # Build font filename (Lato naming convention)
-        weight_name = weight_mapping.get(weight.lower(), 'Regular')
-        italic_suffix = 'Italic' if italic else ''
-        font_filename = f"Lato-{weight_name}{italic_suffix}.ttf"
-        
-        # Try Lato fonts first
-        lato_paths = [
-            os.path.join(self.fonts_dir, font_filename),
-            # Alternative paths for Lato
-            os.path.join(self.fonts_dir, 'static', font_filename),
-            os.path.join(self.fonts_dir, f'Lato-Regular.ttf')  # Fallback to Regular
-        ]
-        
-        # System font fallbacks
-        system_font_paths = [
-            # Linux fonts (Raspberry Pi)
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf" if weight in ['bold', 'semibold', 'extrabold'] else "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-            "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf" if weight in ['bold', 'semibold', 'extrabold'] else "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
-            # macOS fonts
-            "/System/Library/Fonts/Helvetica.ttc",
-            "/System/Library/Fonts/Arial.ttf",
-        ]
-        
-        # Try all font paths
-        all_paths = [p for p in lato_paths if p] + system_font_paths
-        
-        for font_path in all_paths:
-            try:
-                font = ImageFont.truetype(font_path, size)
-                self.font_cache[cache_key] = font
-                return font
-            except Exception as e:
-                continue
-        
-        # Final fallback to default font
-        default_font = ImageFont.load_default()
-        self.font_cache[cache_key] = default_font
-        return default_font
+        return _load_font(_resolve_font_path(weight, italic), size)
     
-    def get_weather_icon_filename(self, weather_code, is_day=True):
-        """Get weather icon filename based on weather code (Visual Crossing 3rd Set)"""
-        # Map weather codes to Visual Crossing Weather Icons 3rd Set filenames
-        icon_mapping = {
-            0: ("clear-day.png", "clear-night.png"),
-            1: ("partly-cloudy-day.png", "partly-cloudy-night.png"),
-            2: ("partly-cloudy-day.png", "partly-cloudy-night.png"),
-            3: ("cloudy.png", "cloudy.png"),
-            45: ("fog.png", "fog.png"),
-            48: ("fog.png", "fog.png"),
-            51: ("rain.png", "rain.png"),  # Using rain.png for showers
-            53: ("rain.png", "rain.png"),
-            55: ("rain.png", "rain.png"),
-            56: ("sleet.png", "sleet.png"),
-            57: ("sleet.png", "sleet.png"),
-            61: ("rain.png", "rain.png"),
-            63: ("rain.png", "rain.png"),
-            65: ("rain.png", "rain.png"),
-            66: ("rain-snow.png", "rain-snow.png"),
-            67: ("rain-snow.png", "rain-snow.png"),
-            68: ("rain-snow.png", "rain-snow.png"),
-            69: ("rain-snow.png", "rain-snow.png"),
-            71: ("snow.png", "snow.png"),
-            73: ("snow.png", "snow.png"),
-            75: ("snow.png", "snow.png"),
-            77: ("snow.png", "snow.png"),
-            80: ("rain.png", "rain.png"),  # Using rain.png for showers
-            81: ("rain.png", "rain.png"),
-            82: ("rain.png", "rain.png"),
-            85: ("snow-showers-day.png", "snow-showers-night.png"),
-            86: ("snow-showers-day.png", "snow-showers-night.png"),
-            95: ("thunder-rain.png", "thunder-rain.png"),  # Using thunder-rain.png
-            96: ("hail.png", "hail.png"),
-            99: ("hail.png", "hail.png"),
-        }
-
-        day_icon, night_icon = icon_mapping.get(weather_code, ("cloudy.png", "cloudy.png"))
-        return day_icon if is_day else night_icon
-    
-    def get_weather_icon_fallback(self, weather_code, is_day=True):
-        """Get fallback Unicode weather icon symbol"""
-        # Fallback weather icons using Unicode symbols
-        weather_icons = {
-            0: "☀" if is_day else "☾",
-            1: "⛅" if is_day else "☾",
-            2: "⛅", 3: "☁",
-            45: "≋", 48: "≋",
-            51: "∴", 53: "∴", 55: "∴",
-            61: "☔", 63: "☔", 65: "☔",
-            71: "❄", 73: "❅", 75: "❆",
-            95: "⚡", 96: "⚡", 99: "⚡"
-        }
-        return weather_icons.get(weather_code, "⛅")
-    
-    def load_png_icon(self, filename, size=(40, 40)):
-        """Load and process PNG icon for e-ink display"""
-        cache_key = f"{filename}_{size[0]}x{size[1]}"
-        if cache_key in self.icon_cache:
-            return self.icon_cache[cache_key]
-            
-        # Check for processed version first
-        base_name = os.path.splitext(filename)[0]
-        processed_file = os.path.join(self.icons_dir, f"{base_name}_processed.png")
-        if os.path.exists(processed_file):
-            icon_path = processed_file
-        else:
-            icon_path = os.path.join(self.icons_dir, filename)
-        if not os.path.exists(icon_path):
-            logger.warning(f"Icon file not found: {icon_path}")
-            return None
-            
-        try:
-            # Load the image and convert to RGBA
-            icon_image = Image.open(icon_path).convert('RGBA')
-            
-            # Create a new white background image
-            processed = Image.new('RGBA', icon_image.size, (255, 255, 255, 0))
-            
-            # Process the image
-            for x in range(icon_image.width):
-                for y in range(icon_image.height):
-                    r, g, b, a = icon_image.getpixel((x, y))
-                    # If pixel is not transparent, make it black
-                    if a > 0 and not (r > 200 and g > 200 and b > 200):
-                        processed.putpixel((x, y), (0, 0, 0, 255))  # Black with full opacity
-            
-            icon_image = processed
-            
-            # Resize if needed
-            if icon_image.size != size:
-                icon_image = icon_image.resize(size, Image.Resampling.LANCZOS)
-            
-            # Convert to 1-bit for e-ink (black and white)
-            icon_image = icon_image.convert('1')
-            
-            # Invert if needed (black symbols on white background)
-            icon_image = Image.eval(icon_image, lambda x: 255 - x)
-            
-            # Cache the processed image
-            self.icon_cache[cache_key] = icon_image
-            return icon_image
-            
-        except Exception as e:
-            logger.error(f"Error loading PNG icon {filename}: {e}")
-            return None
-    
-    def draw_weather_icon_art(self, draw, x, y, weather_code, is_day=True, size="small"):
-        """Draw custom ASCII art weather icons"""
-        font_small = self.get_font(10, weight='regular')  # 12 → 10 (-2)
-        font_tiny = self.get_font(8, weight='light')      # 10 → 8 (-2)
-        
-        if size == "large":
-            # Large ASCII art icons for main weather display
-            if weather_code == 0:  # Clear sky
-                if is_day:
-                    # Sun
-                    lines = [
-                        "  \\   |   /  ",
-                        "   \\  |  /   ",
-                        "--- ( ☀ ) ---",
-                        "   /  |  \\   ",
-                        "  /   |   \\  "
-                    ]
-                else:
-                    # Moon
-                    lines = [
-                        "     ****     ",
-                        "   **    *   ",
-                        "  *   ☾   *  ",
-                        "   **    *   ",
-                        "     ****     "
-                    ]
-            elif weather_code in [1, 2]:  # Partly cloudy
-                lines = [
-                    "   ☀  ~~~    ",
-                    "     ~~☁~~   ",
-                    "   ~~~   ~~  ",
-                    "  ~~       ~ ",
-                    "             "
-                ]
-            elif weather_code == 3:  # Overcast
-                lines = [
-                    "  ~~~☁~~~   ",
-                    " ~~     ~~  ",
-                    "~~  ☁☁  ~~~ ",
-                    " ~~     ~~  ",
-                    "  ~~~~~~~   "
-                ]
-            elif weather_code in [61, 63, 65]:  # Rain
-                lines = [
-                    "  ~~☁☁~~    ",
-                    " ~~     ~~  ",
-                    "~~       ~~ ",
-                    " | | ☔ | |  ",
-                    " | | | | |  "
-                ]
-            elif weather_code in [71, 73, 75]:  # Snow
-                lines = [
-                    "  ~~☁☁~~    ",
-                    " ~~     ~~  ",
-                    "~~   ❄   ~~ ",
-                    " ❅ ❄ ❅ ❄   ",
-                    "   ❄ ❅ ❄   "
-                ]
-            elif weather_code in [95, 96, 99]:  # Thunderstorm
-                lines = [
-                    "  ~~☁☁~~    ",
-                    " ~~     ~~  ",
-                    "~~   ⚡   ~~ ",
-                    " | ⚡ | | |  ",
-                    " | | ⚡ | |  "
-                ]
-            else:
-                # Default cloud
-                lines = [
-                    "   ~~~~~~    ",
-                    "  ~~☁☁~~   ",
-                    " ~~    ~~  ",
-                    "~~      ~~ ",
-                    " ~~~~~~~~  "
-                ]
-            
-            # Draw the ASCII art
-            for i, line in enumerate(lines):
-                draw.text((x, y + i * 8), line, font=font_tiny, fill=0)
-        
-        else:
-            # Small icon for details section
-            icon = self.get_weather_icon_fallback(weather_code, is_day)
-            draw.text((x, y), icon, font=font_small, fill=0)
-    
-    def draw_detail_icons(self, draw, x, y, icon_type):
-        """Draw custom icons for weather details - no icons, text only"""
-        # No icons drawn - just return minimal width for text spacing
-        return 0  # No width needed since no icons are drawn
-    
-    def draw_rounded_rect(self, draw, coords, radius=5, fill=None, outline=None, width=1):
-        """Draw a rounded rectangle"""
-        x1, y1, x2, y2 = coords
-        
-        # Draw the main rectangle
-        draw.rectangle([x1 + radius, y1, x2 - radius, y2], fill=fill, outline=outline, width=width)
-        draw.rectangle([x1, y1 + radius, x2, y2 - radius], fill=fill, outline=outline, width=width)
-        
-        # Draw the corners
-        draw.pieslice([x1, y1, x1 + 2*radius, y1 + 2*radius], 180, 270, fill=fill, outline=outline, width=width)
-        draw.pieslice([x2 - 2*radius, y1, x2, y1 + 2*radius], 270, 360, fill=fill, outline=outline, width=width)
-        draw.pieslice([x1, y2 - 2*radius, x1 + 2*radius, y2], 90, 180, fill=fill, outline=outline, width=width)
-        draw.pieslice([x2 - 2*radius, y2 - 2*radius, x2, y2], 0, 90, fill=fill, outline=outline, width=width)
-    
-    def create_weather_image(self, weather_data):
-        """Create modern weather display image with improved design"""
-        logger.debug("Creating weather image with data: %s", weather_data)
-        
-        # Create image with natural dimensions
-        image = Image.new('1', (self.width, self.height), 255)
-        draw = ImageDraw.Draw(image)
-        
-        # Debug: Draw a border around the image
-        draw.rectangle([(0, 0), (self.width-1, self.height-1)], outline=0)
-        
-        # Enhanced fonts with Lato hierarchy - SMALLER SIZES
-        font_title = self.get_font(16, weight='semibold')    # 18 → 16 (-2)
-        font_temp = self.get_font(34, weight='bold')         # 38 → 34 (-4) 
-        font_medium = self.get_font(14, weight='medium')     # 16 → 14 (-2)
-        font_small = self.get_font(12, weight='regular')     # 14 → 12 (-2)
-        font_tiny = self.get_font(10, weight='light')       # 12 → 10 (-2)
-        
-        # Current time and date
-        now = datetime.now()
-        current_time = now.strftime("%H:%M")
-        current_date = now.strftime("%d.%m.%Y")
-        weekday = now.strftime("%A")[:2].upper()  # Short weekday
-        
-        # Colors (for monochrome: 0=black, 255=white)
-        BLACK = 0
-        WHITE = 255
-        
-        # Layout constants
-        margin = 8  # Increased margin to move content away from corners
-        header_height = 24  # Increased for bigger time font
-        
-        # === HEADER SECTION ===
-        # Header background
-        draw.rectangle([0, 0, self.width, header_height], fill=BLACK)
-        
-        # Date and time in header (white text on black background)
-        draw.text((margin, 3), f"{weekday} {current_date}", font=font_small, fill=WHITE)
-        
-        # Time on the right side - BIGGER FONT
-        time_font = self.get_font(16, weight='bold')  # Bigger and bold for prominence
-        time_bbox = draw.textbbox((0, 0), current_time, font=time_font)
-        time_x = self.width - time_bbox[2] - margin
-        draw.text((time_x, 2), current_time, font=time_font, fill=WHITE)
-        
-        # === MAIN CONTENT AREA ===
-        content_y = header_height + 3
-        
-        # City name (no underline)
-        city = weather_data.get('city', 'Unknown')
-        draw.text((margin, content_y), city, font=font_title, fill=BLACK)
-        
-        # === LEFT COLUMN - TEMPERATURE AND WEATHER ===
-        temp_y = content_y + 24  # More space from city name
-        
-        # Temperature (large and prominent)
-        temp = weather_data.get('temperature', 0)
-        temp_text = f"{temp:.0f}°"
-        draw.text((margin, temp_y), temp_text, font=font_temp, fill=BLACK)
-        
-        # No weather icons - text only display
-        
-        # Weather description (positioned below temperature)
-        description = weather_data.get('description', 'Unknown')
-        if len(description) > 25:  # More space available without details panel
-            description = description[:25] + "..."
-        desc_y = temp_y + 38
-        draw.text((margin, desc_y), description.title(), font=font_medium, fill=BLACK)
-        
-        # === RIGHT SIDE - WEATHER ICON ===
-        # Visual Crossing Weather Icons 3rd Set (50x50px)
-        weather_code = weather_data.get('weather_code', 0)
-        is_day = weather_data.get('is_day', True)
-        
-        icon_size = 50
-        icon_x = self.width - icon_size - margin
-        icon_y = max(header_height + 2, (self.height - icon_size) // 2)  # Centered vertically on the right
-        
-        # Draw programmatic weather icon
-        draw = ImageDraw.Draw(image)
+    def _draw_icon(self, draw, icon_type, icon_size):
+        """Draw a programmatic weather icon with its frame at the origin of draw"""
+        icon_x, icon_y = 0, 0
         
         # Draw a white rectangle for the icon area with a thin border
         draw.rectangle([
@@ -512,23 +482,21 @@ class DisplayManager:
         ], fill=1, outline=0)  # White fill, black border
         
         # Draw different icons based on weather code
-        if weather_data['weather_code'] == 0:  # Clear sky
+        if icon_type == 'clear':  # Clear sky
             # Sun
             center_x, center_y = icon_x + icon_size//2, icon_y + icon_size//2
             radius = icon_size // 3
             # Sun rays
-            for angle in range(0, 360, 30):
-                rad = math.radians(angle)
-                end_x = center_x + int(math.cos(rad) * (radius + 5))
-                end_y = center_y + int(math.sin(rad) * (radius + 5))
-                draw.line([(center_x, center_y), (end_x, end_y)], fill=0, width=1)
+            ray_offsets = (_SUN_RAY_DIRECTIONS * (radius + 5)).astype(int)
+            for dx, dy in ray_offsets.tolist():
+                draw.line([(center_x, center_y), (center_x + dx, center_y + dy)], fill=0, width=1)
             # Sun center
             draw.ellipse([
                 (center_x - radius, center_y - radius),
                 (center_x + radius, center_y + radius)
             ], fill=0)
                 
-        elif weather_data['weather_code'] in [1, 2]:  # Partly cloudy
+        elif icon_type == 'partly_cloudy':  # Partly cloudy
             # Sun peeking from behind cloud
             # Sun (top right)
             sun_x, sun_y = icon_x + icon_size*2//3, icon_y + icon_size//3
@@ -549,7 +517,7 @@ class DisplayManager:
                 (cloud_x + cloud_w, cloud_y + cloud_h//2)
             ], fill=0)
             
-        elif weather_data['weather_code'] in [3, 45, 48]:  # Overcast, fog
+        elif icon_type == 'cloudy':  # Overcast, fog
             # Simple cloud
             cloud_x, cloud_y = icon_x + icon_size//2, icon_y + icon_size//2
             cloud_w, cloud_h = icon_size*2//3, icon_size//3
@@ -562,7 +530,7 @@ class DisplayManager:
                 (cloud_x + cloud_w*3//4, cloud_y + cloud_h//2)
             ], fill=0)
             
-        elif weather_data['weather_code'] in [51, 53, 55, 61, 63, 65, 80, 81, 82]:  # Rain
+        elif icon_type == 'rain':  # Rain
             # Cloud with rain
             cloud_x, cloud_y = icon_x + icon_size//2, icon_y + icon_size//3
             cloud_w, cloud_h = icon_size*2//3, icon_size//3
@@ -584,7 +552,7 @@ class DisplayManager:
                     (drop_x - 2, drop_y + cloud_h//2)
                 ], fill=0, width=1)
                 
-        elif weather_data['weather_code'] in [71, 73, 75, 77, 85, 86]:  # Snow
+        elif icon_type == 'snow':  # Snow
             # Cloud with snow
             cloud_x, cloud_y = icon_x + icon_size//2, icon_y + icon_size//3
             cloud_w, cloud_h = icon_size*2//3, icon_size//3
@@ -611,7 +579,7 @@ class DisplayManager:
                     (flake_x, flake_y + 2)
                 ], fill=0, width=1)
                 
-        elif weather_data['weather_code'] in [95, 96, 99]:  # Thunderstorm
+        elif icon_type == 'thunderstorm':  # Thunderstorm
             # Cloud with lightning
             cloud_x, cloud_y = icon_x + icon_size//2, icon_y + icon_size//3
             cloud_w, cloud_h = icon_size*2//3, icon_size//3
@@ -647,38 +615,203 @@ class DisplayManager:
                  icon_y + (icon_size - text_height)//2),
                 text, font=font, fill=0
             )
-            
-        logger.debug(f"Drew weather icon at ({icon_x}, {icon_y})")
+    
+    def _get_icon_image(self, icon_type, icon_size=50):
+        """Get the pre-rendered 1-bit icon image (frame included) for an icon type"""
+        cache_key = (icon_type, icon_size)
+        icon_image = self._icon_images.get(cache_key)
+        if icon_image is None:
+            size = (icon_size + 1, icon_size + 1)
+            if cache_key not in _ICON_CACHE:
+                icon_image = Image.new('1', size, 255)
+                self._draw_icon(ImageDraw.Draw(icon_image), icon_type, icon_size)
+                _ICON_CACHE[cache_key] = icon_image.tobytes()
+            # Wrapped once; paste only reads it, so every frame shares this image
+            icon_image = self._icon_images[cache_key] = Image.frombytes('1', size, _ICON_CACHE[cache_key])
+        return icon_image
+    
+    def _build_layout(self):
+        """Pre-render the static chrome, clock glyphs and programmatic icons"""
+        time_font = self._font_time
+        for icon_type in ('clear', 'partly_cloudy', 'cloudy', 'rain', 'snow', 'thunderstorm', 'unknown'):
+            self._get_icon_image(icon_type)
+        self._template_image = Image.fromarray(self._build_background_template())  # Static chrome as a mode '1' image
+        # Glyph metrics to right-align the HH:MM clock without measuring it per frame
+        self._time_advance = {c: time_font.getlength(c) for c in '0123456789:'}
+        self._time_right = {c: time_font.getbbox(c)[2] for c in '0123456789:'}
+        self._clock_masks = {char: Image.fromarray(tile) for char, tile in self._build_clock_glyphs(time_font).items()}
+        self._time_x = {}  # Clock x position per HH:MM string (at most 1440 entries)
+    
+    def _build_background_template(self):
+        """Build the static chrome (border and header bar) as a 1-bit pixel array"""
+        template = np.ones((self.height, self.width), dtype=bool)  # True = white
+        template[[0, -1], :] = False  # Border
+        template[:, [0, -1]] = False
+        template[:HEADER_HEIGHT + 1, :] = False  # Header bar
+        return template
+    
+    def _build_clock_glyphs(self, font):
+        """Rasterize the clock characters once into 1-bit tiles (True = ink)"""
+        glyphs = {}
+        for char in '0123456789:':
+            left, top, right, bottom = font.getbbox(char)
+            tile = Image.new('1', (right, bottom), 0)
+            ImageDraw.Draw(tile).text((0, 0), char, font=font, fill=1)
+            glyphs[char] = np.asarray(tile, dtype=bool)
+        return glyphs
+    
+    def _paste_text(self, image, xy, text, masks, advances):
+        """Stamp white text into a 1-bit image from pre-rasterized glyph masks"""
+        x, y = xy
+        for char in text:
+            image.paste(255, (x, y), masks[char])
+            x += int(advances[char])
+    
+    def _static_layer(self, fields):
+        """Chrome with the rarely changing fields drawn in, re-rendered only when they change"""
+        key = tuple(fields[field] for field in self._STATIC_FIELDS)
+        if key != self._static_layer_key:
+            image = self._template_image.copy()
+            draw = ImageDraw.Draw(image)
+            for x, y, font_key, fill, field in self._TEXT_LAYOUT:
+                if field in self._STATIC_FIELDS:
+                    draw.text((x, y), fields[field], font=self._fonts[font_key], fill=fill)
+            self._static_layer_image = image
+            self._static_layer_key = key
+        return self._static_layer_image
+    
+    def create_weather_image(self, weather_data):
+        """Create modern weather display image with improved design (reused canvas, see __init__)"""
+        logger.debug("Creating weather image with data: %s", weather_data)
+        
+        # Current time and date (formatted once per minute)
+        weekday, current_date, current_time = _time_strings(int(time.time()) // 60)
+        
+        # === TEXT FIELDS ===
+        # Derived strings and icon are reused while the rendered inputs are unchanged
+        key = (weather_data.city, weather_data.temperature, weather_data.description, weather_data.weather_code)
+        if self._last_weather_render is None or self._last_weather_render[0] != key:
+            description = weather_data.description
+            if len(description) > 25:  # More space available without details panel
+                description = description[:25] + "..."
+            derived = (
+                weather_data.city,
+                f"{weather_data.temperature:.0f}°",
+                description.title(),
+                _icon_type(weather_data.weather_code),
+            )
+            self._last_weather_render = (key, derived)
+        city, temperature, description, icon_type = self._last_weather_render[1]
+        fields = {
+            'date': f"{weekday} {current_date}",
+            'city': city,
+            'temperature': temperature,
+            'description': description,
+        }
+        
+        # === HEADER SECTION ===
+        # Start from the prerendered chrome + date + city layer
+        image = self._canvas
+        image.paste(self._static_layer(fields))
+        
+        # Time on the right side - BIGGER FONT, blitted from cached glyph tiles
+        time_x = self._time_x.get(current_time)
+        if time_x is None:
+            # Right edge = advances of all but the last glyph + the last glyph's ink edge
+            time_width = sum(self._time_advance[c] for c in current_time[:-1]) + self._time_right[current_time[-1]]
+            time_x = self._time_x[current_time] = DISPLAY_WIDTH - int(time_width) - MARGIN
+        self._paste_text(image, (time_x, 2), current_time, self._clock_masks, self._time_advance)
+        
+        draw = self._canvas_draw
+        for x, y, font_key, fill, field in self._TEXT_LAYOUT:
+            if field not in self._STATIC_FIELDS:
+                draw.text((x, y), fields[field], font=self._fonts[font_key], fill=fill)
+        
+        # === RIGHT SIDE - WEATHER ICON ===
+        # Paste the pre-rendered icon (frame included)
+        image.paste(self._get_icon_image(icon_type, ICON_SIZE), (ICON_X, ICON_Y))
+        
+        logger.debug("Drew weather icon at (%d, %d)", ICON_X, ICON_Y)
         
         return image
     
+    def _pack_framebuffer(self, pixels):
+        """Pack landscape 1-bit pixels (True = white) into the reused panel framebuffer"""
+        # Rotate into the panel's portrait orientation like epd.getbuffer does
+        self._fb_rows[...] = np.packbits(np.rot90(pixels), axis=1)
+        return self._fb
+    
     def show_weather(self, weather_data):
         """Display weather data on the e-ink screen"""
         try:
+            # Skip the redraw when nothing that is drawn changed: the shown minute, city,
+            # temperature as displayed, description and weather code (humidity, wind etc.
+            # are not on the panel, so changes there alone need no refresh)
+            sig = hash((
+                weather_data.city,
+                f"{weather_data.temperature:.0f}",
+                weather_data.description,
+                weather_data.weather_code,
+                int(time.time()) // 60
+            ))
+            if sig == self._last_sig:
+                logger.debug("Weather data unchanged, skipping display update")
+                return
+            
             # Create the weather image (black/white only)
             image = self.create_weather_image(weather_data)
-            image = image.rotate(180)
+            
+            # Rotate by 180 degrees as a zero-copy stride flip
+            rendered = np.asarray(image, dtype=bool)
+            pixels = rendered[::-1, ::-1]
             
             if self.epd:
-                # Convert image to display buffer format
-                buffer = self.epd.getbuffer(image)
+                # Convert image to display buffer format; queue a snapshot since
+                # the framebuffer is reused for the next frame
+                buffer = self._pack_framebuffer(pixels)
                 
-                # Display on e-paper (single image for B/W display)
-                self.epd.display(buffer)
-                logger.info("Weather data displayed on e-paper")
+                # The panel already shows (or is about to show) an identical frame
+                buffer_hash = hashlib.blake2b(buffer, digest_size=8).digest()
+                if buffer_hash == self._last_buffer_hash:
+                    logger.debug("Framebuffer unchanged, skipping panel refresh")
+                    self._last_sig = sig
+                    return
+                self._last_buffer_hash = buffer_hash
+                self._queue_frame(bytes(buffer), self._dirty_regions(rendered))
             else:
-                # Save image for development/testing
-                image.save('weather_display.png')
-                logger.info("Weather image saved (development mode)")
+                # Save image for development/testing (superseding a save still waiting to run)
+                if self._png_save is not None:
+                    self._png_save.cancel()
+                self._png_save = self._io_pool.submit(self._save_png, Image.fromarray(pixels), 'weather_display.png')
+            
+            self._last_sig = sig
                 
         except Exception as e:
             logger.error(f"Error displaying weather data: {e}")
     
+    def _save_png(self, image, path):
+        """Write a development frame to disk (runs on the PNG save thread)"""
+        try:
+            image.save(path)
+            logger.info("Weather image saved (development mode)")
+        except Exception as e:
+            logger.error(f"Error saving weather image: {e}")
+    
     def clear_display(self):
         """Clear the e-ink display"""
         if self.epd:
             try:
-                self.epd.Clear()
+                self._drop_pending_frame()
+                with self._epd_lock:
+                    if self._partial_updates or self._asleep:
+                        self.epd.init()  # Leave partial refresh mode / deep sleep first
+                        self._asleep = False
+                    self.epd.Clear()
+                    self._partial_updates = None
+                    self._panel_buffer = None
+                self._last_sig = None
+                self._last_buffer_hash = None
+                self._last_pixels = None
                 logger.info("Display cleared")
             except Exception as e:
                 logger.error(f"Error clearing display: {e}")
@@ -687,7 +820,12 @@ class DisplayManager:
         """Put the display to sleep mode"""
         if self.epd:
             try:
-                self.epd.sleep()
+                self._frames.join()  # Let queued frames reach the panel first
+                with self._epd_lock:
+                    if not self._asleep:
+                        # Deep sleep mode 1 keeps RAM, so the partial base image survives
+                        self.epd.sleep()
+                        self._asleep = True
                 logger.info("Display put to sleep")
             except Exception as e:
                 logger.error(f"Error putting display to sleep: {e}")
@@ -9,7 +9,9 @@ Features:
 
 import os
 import logging
-from PIL import Image, ImageDraw, ImageFont
+import queue
+import threading
+from PIL import Image, ImageChops, ImageDraw, ImageFont
 from datetime import datetime
 import time
 
@@ -26,6 +28,10 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Debug preview goes to tmpfs when available, sparing the SD card
+PREVIEW_FILE = ('/dev/shm/weather_display_preview.png' if os.path.isdir('/dev/shm')
+                else 'weather_display_preview.png')
+
 # Weather Icons mapping (using Weather Icons 2.0)
 WEATHER_ICONS = {
     # Day icons
@@ -46,6 +52,19 @@ WEATHER_ICONS = {
     'default': '\uf03e'
 }
 
+# Glyph per (condition, is_day); at night '-day' conditions show their '-night' icon
+_ICON_GLYPH = {
+    (key, is_day): WEATHER_ICONS.get(key if is_day or not key.endswith('-day') else key.replace('-day', '-night'),
+                                     WEATHER_ICONS['default'])
+    for key in WEATHER_ICONS
+    for is_day in (True, False)
+}
+
+# Forecast day block: icon at the origin, temperatures 30 px right (clipped by the panel bottom)
+FORECAST_BLOCK_WIDTH = 100
+FORECAST_BLOCK_HEIGHT = 42
+FORECAST_CACHE_SIZE = 64
+
 class EnhancedDisplayManager:
     def __init__(self):
         """Initialize the enhanced display manager"""
@@ -64,19 +83,67 @@ class EnhancedDisplayManager:
                 logger.error(f"Failed to initialize display: {e}")
                 self.epd = None
         
+        # Panel refreshes run on a worker thread; the 1-slot queue keeps only the newest frame
+        if self.epd:
+            self._frames = queue.Queue(maxsize=1)
+            self._epd_lock = threading.Lock()
+            self._display_thread = threading.Thread(target=self._display_worker, name='epd-display', daemon=True)
+            self._display_thread.start()
+        
+        # Write a preview PNG per update only when asked to, or when there is no panel to look at
+        self.debug_preview = bool(int(os.environ.get('WEATHER_DEBUG_PREVIEW', '0'))) or self.epd is None
+        
         # Load fonts
         self._load_fonts()
         
-        # Create image buffers
+        # Create image buffer (black/white only)
         self.image_black = Image.new('1', (self.width, self.height), 255)  # 1 for black/white
-        self.image_red = Image.new('1', (self.width, self.height), 255)    # 1 for red
         
-        # Drawing contexts
+        # Blank black plane with the border already drawn, pasted to clear each frame
+        self._black_template = Image.new('1', (self.width, self.height), 255)
+        ImageDraw.Draw(self._black_template).rectangle([0, 0, self.width-1, self.height-1], outline=0)
+        
+        # Drawing context
         self.draw_black = ImageDraw.Draw(self.image_black)
-        self.draw_red = ImageDraw.Draw(self.image_red)
+        
+        # Last rendered inputs and black plane, to skip redundant panel refreshes
+        self._last_state = None
+        self._last_image_black = None
+    
+    def _display_worker(self):
+        """Push queued frames to the panel one at a time"""
+        while True:
+            buffer = self._frames.get()
+            try:
+                with self._epd_lock:
+                    self.epd.display(buffer)
+            except Exception as e:
+                logger.error(f"Error updating display: {e}")
+                # Redraw on the next update
+                self._last_state = None
+                self._last_image_black = None
+            finally:
+                self._frames.task_done()
+    
+    def _queue_frame(self, buffer):
+        """Hand a frame to the display worker, replacing one that is still waiting"""
+        self._drop_pending_frame()
+        self._frames.put_nowait(buffer)
+    
+    def _drop_pending_frame(self):
+        """Discard a frame the display worker has not picked up yet"""
+        try:
+            self._frames.get_nowait()
+            self._frames.task_done()
+        except queue.Empty:
+            pass
     
     def _load_fonts(self):
         """Load required fonts with fallbacks"""
+        # Measurements and glyphs belong to the previous font objects
+        self._text_widths = {}  # Rendered text widths keyed by (font id, text)
+        self._glyphs = {}  # (1-bit mask, advance) keyed by (font id, char)
+        self._forecast_blocks = {}  # Forecast block masks keyed by (condition, is_day, high, low)
         try:
             # Try to load Lato font (downloaded by download_weather_icons.sh)
             self.font_small = ImageFont.truetype('fonts/Lato-Regular.ttf', 12)
@@ -90,25 +157,73 @@ class EnhancedDisplayManager:
             self.font_medium = ImageFont.load_default()
             self.font_large = ImageFont.load_default()
             self.font_icons = ImageFont.load_default()
+        
+        # Rasterize the glyphs every frame uses up front; icons keyed by (condition, is_day)
+        self._icon_sprites = {key: self._glyph(self.font_icons, icon_char)
+                              for key, icon_char in _ICON_GLYPH.items()}
+        self._default_icon_sprite = self._glyph(self.font_icons, WEATHER_ICONS['default'])
+        for font in (self.font_small, self.font_medium, self.font_large):
+            for char in '0123456789-.°C':
+                self._glyph(font, char)
+    
+    def _icon_sprite(self, condition, is_day):
+        """(1-bit mask, advance) of the weather icon for a condition"""
+        return self._icon_sprites.get((condition.lower(), bool(is_day)), self._default_icon_sprite)
     
     def _draw_weather_icon(self, x, y, condition, is_day=True, size=24):
         """Draw a weather icon at the specified position"""
-        icon_key = condition.lower()
-        if not is_day and icon_key.endswith('-day'):
-            icon_key = icon_key.replace('-day', '-night')
-        
-        icon_char = WEATHER_ICONS.get(icon_key, WEATHER_ICONS['default'])
-        self.draw_black.text((x, y), icon_char, font=self.font_icons, fill=0)
+        mask, advance = self._icon_sprite(condition, is_day)
+        self.image_black.paste(0, (int(x), int(y)), mask)
         
         # Return the icon dimensions
-        return self.font_icons.getsize(icon_char)
+        return int(advance), mask.height
     
-    def _draw_centered_text(self, text, y, font, color='black'):
+    def _text_width(self, text, font):
+        """Width of text in font, measured by FreeType once per (font, text)"""
+        key = (id(font), text)
+        width = self._text_widths.get(key)
+        if width is None:
+            width = self._text_widths[key] = font.getlength(text)
+        return width
+    
+    def _glyph(self, font, char):
+        """1-bit mask and advance of a character, rasterized by FreeType once per font"""
+        key = (id(font), char)
+        glyph = self._glyphs.get(key)
+        if glyph is None:
+            left, top, right, bottom = font.getbbox(char)
+            mask = Image.new('1', (max(right, 1), max(bottom, 1)), 0)
+            ImageDraw.Draw(mask).text((0, 0), char, font=font, fill=1)
+            glyph = self._glyphs[key] = (mask, font.getlength(char))
+        return glyph
+    
+    def _blit_text(self, image, xy, text, font, ink=0):
+        """Stamp text (black by default) into a 1-bit image from cached glyph masks"""
+        x, y = xy
+        for char in text:
+            mask, advance = self._glyph(font, char)
+            image.paste(ink, (int(x), int(y)), mask)
+            x += advance
+    
+    def _forecast_block(self, condition, is_day, high, low):
+        """Mask of one forecast day (icon, high and low), composed once per distinct forecast"""
+        key = (condition, is_day, high, low)
+        block = self._forecast_blocks.get(key)
+        if block is None:
+            block = Image.new('1', (FORECAST_BLOCK_WIDTH, FORECAST_BLOCK_HEIGHT), 0)
+            block.paste(1, (0, 0), self._icon_sprite(condition, is_day)[0])
+            self._blit_text(block, (30, 5), f"{high}°", self.font_medium, ink=1)
+            self._blit_text(block, (30, 20), f"{low}°", self.font_small, ink=1)
+            if len(self._forecast_blocks) >= FORECAST_CACHE_SIZE:
+                del self._forecast_blocks[next(iter(self._forecast_blocks))]  # Oldest first
+            self._forecast_blocks[key] = block
+        return block
+    
+    def _draw_centered_text(self, text, y, font):
         """Draw centered text at the specified y position"""
-        draw = self.draw_black if color == 'black' else self.draw_red
-        text_width = draw.textlength(text, font=font)
+        text_width = self._text_width(text, font)
         x = (self.width - text_width) // 2
-        draw.text((x, y), text, font=font, fill=0)
+        self._blit_text(self.image_black, (x, y), text, font)
         return y + font.size + 2
     
     def update_display(self, weather_data):
@@ -117,70 +232,78 @@ class EnhancedDisplayManager:
             logger.error("No weather data provided")
             return
         
-        # Clear the display buffers
-        self.draw_black.rectangle((0, 0, self.width, self.height), fill=255)
-        self.draw_red.rectangle((0, 0, self.width, self.height), fill=255)
-        
         # Get current time for day/night determination
-        current_hour = datetime.now().hour
-        is_day = 6 <= current_hour < 18  # Simple day/night detection
+        now = datetime.now()
+        is_day = 6 <= now.hour < 18  # Simple day/night detection
         
-        # Draw header with location and date
         try:
             location = weather_data.get('location', 'Unknown')
-            self._draw_centered_text(location, 2, self.font_medium)
+            date_str = now.strftime('%a, %b %d')
+            current_temp = f"{weather_data.get('current_temp', '--')}°C"
+            current_condition = weather_data.get('current_condition', 'clear-day')
+            forecast = weather_data.get('forecast', [])
             
-            date_str = datetime.now().strftime('%a, %b %d')
+            # The frame is drawn from these values alone, so equal inputs mean an equal frame
+            state = (location, date_str, current_temp, current_condition, is_day,
+                     tuple(tuple(sorted(day.items())) for day in forecast[:2]))
+            if state == self._last_state:
+                logger.debug("Weather data unchanged, skipping display update")
+                return
+            
+            # Clear the display buffer (it starts from the bordered template)
+            self.image_black.paste(self._black_template)
+            
+            # Draw header with location and date
+            self._draw_centered_text(location, 2, self.font_medium)
             self._draw_centered_text(date_str, 20, self.font_small)
             
             # Draw current weather (large icon and temperature)
-            current_temp = f"{weather_data.get('current_temp', '--')}°C"
-            current_condition = weather_data.get('current_condition', 'clear-day')
-            
             # Draw current weather icon
             icon_x = (self.width - 60) // 2
             self._draw_weather_icon(icon_x, 40, current_condition, is_day, 40)
             
             # Draw current temperature
-            temp_width = self.font_large.getlength(current_temp)
+            temp_width = self._text_width(current_temp, self.font_large)
             temp_x = (self.width - temp_width) // 2
-            self.draw_black.text((temp_x, 40), current_temp, font=self.font_large, fill=0)
+            self._blit_text(self.image_black, (temp_x, 40), current_temp, self.font_large)
             
-            # Draw forecast for next 2 days
-            forecast = weather_data.get('forecast', [])
+            # Draw forecast for next 2 days (icon with high/low to its right)
             if len(forecast) >= 2:
-                # Day 1 forecast
-                day1 = forecast[0]
-                day1_icon_x = 30
-                self._draw_weather_icon(day1_icon_x, 80, day1.get('condition', 'clear-day'), is_day, 20)
-                self.draw_black.text((day1_icon_x + 30, 85), f"{day1.get('high', '--')}°", font=self.font_medium, fill=0)
-                self.draw_black.text((day1_icon_x + 30, 100), f"{day1.get('low', '--')}°", font=self.font_small, fill=0)
-                
-                # Day 2 forecast
-                day2 = forecast[1]
-                day2_icon_x = 150
-                self._draw_weather_icon(day2_icon_x, 80, day2.get('condition', 'clear-day'), is_day, 20)
-                self.draw_black.text((day2_icon_x + 30, 85), f"{day2.get('high', '--')}°", font=self.font_medium, fill=0)
-                self.draw_black.text((day2_icon_x + 30, 100), f"{day2.get('low', '--')}°", font=self.font_small, fill=0)
+                for day, day_x in zip(forecast, (30, 150)):
+                    block = self._forecast_block(day.get('condition', 'clear-day'), is_day,
+                                                 day.get('high', '--'), day.get('low', '--'))
+                    self.image_black.paste(0, (day_x, 80), block)
             
-            # Add a subtle border
-            self.draw_black.rectangle([0, 0, self.width-1, self.height-1], outline=0)
+            # Different inputs can still render the same pixels (e.g. an unknown condition)
+            if (self._last_image_black is not None
+                    and ImageChops.difference(self._last_image_black, self.image_black).getbbox() is None):
+                logger.debug("Rendered frame unchanged, skipping display update")
+                self._last_state = state
+                return
             
-            # Update the display
+            # Update the display (the worker pushes it; the caller does not wait on the waveform)
             if self.epd:
-                self.epd.display(self.epd.getbuffer(self.image_black), self.epd.getbuffer(self.image_red))
+                self._queue_frame(self.epd.getbuffer(self.image_black))
             
             # Save a preview image for debugging
-            self.image_black.save('weather_display_preview.png')
+            if self.debug_preview:
+                self.image_black.save(PREVIEW_FILE)
+            
+            self._last_state = state
+            self._last_image_black = self.image_black.copy()
             
         except Exception as e:
             logger.error(f"Error updating display: {e}")
     
     def clear(self):
         """Clear the display"""
+        self._last_state = None
+        self._last_image_black = None
         if self.epd:
-            self.epd.Clear(0xFF)
-            self.epd.sleep()
+            self._frames.join()  # Let a queued frame finish before the panel sleeps
+            with self._epd_lock:
+                self.epd.Clear(0xFF)
+                self.epd.sleep()
 
 # Example usage
 if __name__ == "__main__":
@@ -199,7 +322,7 @@ if __name__ == "__main__":
     display = EnhancedDisplayManager()
     try:
         display.update_display(test_data)
-        print("Display updated with test data. Check weather_display_preview.png")
+        print(f"Display updated with test data. Check {PREVIEW_FILE}")
     finally:
         # Make sure to clear the display when done
         display.clear()
@@ -28,6 +28,7 @@
 #
 
 import logging
+from PIL import Image
 from . import epdconfig
 
 # Display resolution
@@ -36,6 +37,16 @@ EPD_HEIGHT = 250
 
 logger = logging.getLogger(__name__)
 
+# Full-panel RAM planes of one byte value, built once per color
+_PLANE_SIZE = ((EPD_WIDTH + 7) // 8) * EPD_HEIGHT
+_SOLID_PLANES = {}
+
+def _solid_plane(color):
+    plane = _SOLID_PLANES.get(color)
+    if plane is None:
+        plane = _SOLID_PLANES[color] = bytes([color]) * _PLANE_SIZE
+    return plane
+
 class EPD:
     def __init__(self):
         self.reset_pin = epdconfig.RST_PIN
@@ -44,6 +55,7 @@ class EPD:
         self.cs_pin = epdconfig.CS_PIN
         self.width = EPD_WIDTH
         self.height = EPD_HEIGHT
+        self._cleared_color = None  # Fill the panel shows after Clear(), None once anything else is drawn
 
     def reset(self):
         epdconfig.digital_write(self.reset_pin, 1)
@@ -71,50 +83,51 @@ class EPD:
         epdconfig.spi_writebyte2(data)
         epdconfig.digital_write(self.cs_pin, 1)
 
-    def ReadBusy(self):
+    def send_command_data(self, command, data):
+        # Command byte and its parameters in one CS-low transaction; only DC flips in between
+        epdconfig.digital_write(self.dc_pin, 0)
+        epdconfig.digital_write(self.cs_pin, 0)
+        epdconfig.spi_writebyte([command])
+        epdconfig.digital_write(self.dc_pin, 1)
+        epdconfig.spi_writebyte2(data)
+        epdconfig.digital_write(self.cs_pin, 1)
+
+    def ReadBusy(self, poll_ms=10):
         logger.debug("e-Paper busy")
-        while(epdconfig.digital_read(self.busy_pin) == 1):      # 0: idle, 1: busy
-            epdconfig.delay_ms(10)
+        epdconfig.wait_for_low(self.busy_pin, poll_ms)      # 0: idle, 1: busy
         logger.debug("e-Paper busy release")
 
     def TurnOnDisplay(self):
-        self.send_command(0x22) # Display Update Control
-        self.send_data(0xf7)
+        self.send_command_data(0x22, b'\xf7') # Display Update Control
         self.send_command(0x20) # Activate Display Update Sequence
         self.ReadBusy()
 
     def TurnOnDisplay_Fast(self):
-        self.send_command(0x22) # Display Update Control
-        self.send_data(0xC7)    # fast:0x0c, quality:0x0f, 0xcf
+        self.send_command_data(0x22, b'\xc7') # Display Update Control (fast:0x0c, quality:0x0f, 0xcf)
         self.send_command(0x20) # Activate Display Update Sequence
         self.ReadBusy()
 
     def TurnOnDisplayPart(self):
-        self.send_command(0x22) # Display Update Control
-        self.send_data(0xff)    # fast:0x0c, quality:0x0f, 0xcf
+        self.send_command_data(0x22, b'\xff') # Display Update Control (fast:0x0c, quality:0x0f, 0xcf)
         self.send_command(0x20) # Activate Display Update Sequence
         self.ReadBusy()
 
     def SetWindow(self, x_start, y_start, x_end, y_end):
-        self.send_command(0x44) # SET_RAM_X_ADDRESS_START_END_POSITION
+        # SET_RAM_X_ADDRESS_START_END_POSITION
         # x point must be the multiple of 8 or the last 3 bits will be ignored
-        self.send_data((x_start>>3) & 0xFF)
-        self.send_data((x_end>>3) & 0xFF)
+        self.send_command_data(0x44, bytes(((x_start>>3) & 0xFF, (x_end>>3) & 0xFF)))
 
-        self.send_command(0x45) # SET_RAM_Y_ADDRESS_START_END_POSITION
-        self.send_data(y_start & 0xFF)
-        self.send_data((y_start >> 8) & 0xFF)
-        self.send_data(y_end & 0xFF)
-        self.send_data((y_end >> 8) & 0xFF)
+        # SET_RAM_Y_ADDRESS_START_END_POSITION
+        self.send_command_data(0x45, bytes((y_start & 0xFF, (y_start >> 8) & 0xFF,
+                                            y_end & 0xFF, (y_end >> 8) & 0xFF)))
 
     def SetCursor(self, x, y):
-        self.send_command(0x4E) # SET_RAM_X_ADDRESS_COUNTER
+        # SET_RAM_X_ADDRESS_COUNTER
         # x point must be the multiple of 8 or the last 3 bits will be ignored
-        self.send_data(x & 0xFF)
+        self.send_command_data(0x4E, bytes((x & 0xFF,)))
 
-        self.send_command(0x4F) # SET_RAM_Y_ADDRESS_COUNTER
-        self.send_data(y & 0xFF)
-        self.send_data((y >> 8) & 0xFF)
+        # SET_RAM_Y_ADDRESS_COUNTER
+        self.send_command_data(0x4F, bytes((y & 0xFF, (y >> 8) & 0xFF)))
 
     def init(self):
         if (epdconfig.module_init() != 0):
@@ -126,26 +139,18 @@ class EPD:
         self.send_command(0x12)  #SWRESET
         self.ReadBusy()
 
-        self.send_command(0x01) #Driver output control
-        self.send_data(0xf9)
-        self.send_data(0x00)
-        self.send_data(0x00)
+        self.send_command_data(0x01, b'\xf9\x00\x00') #Driver output control
 
-        self.send_command(0x11) #data entry mode
-        self.send_data(0x03)
+        self.send_command_data(0x11, b'\x03') #data entry mode
 
         self.SetWindow(0, 0, self.width-1, self.height-1)
         self.SetCursor(0, 0)
 
-        self.send_command(0x3c)
-        self.send_data(0x05)
+        self.send_command_data(0x3c, b'\x05')
 
-        self.send_command(0x21) #  Display update control
-        self.send_data(0x00)
-        self.send_data(0x80)
+        self.send_command_data(0x21, b'\x00\x80') #  Display update control
 
-        self.send_command(0x18)
-        self.send_data(0x80)
+        self.send_command_data(0x18, b'\x80')
 
         self.ReadBusy()
 
@@ -154,73 +159,68 @@ class EPD:
     def getbuffer(self, image):
         img = image
         imwidth, imheight = img.size
-        if(imwidth == self.width and imheight == self.height):
-            img = img.convert('1')
-        elif(imwidth == self.height and imheight == self.width):
+        if(imwidth == self.height and imheight == self.width):
             # image has correct dimensions, but needs to be rotated
-            img = img.rotate(90, expand=True).convert('1')
-        else:
+            img = img.transpose(Image.ROTATE_90)
+        elif(imwidth != self.width or imheight != self.height):
             logger.warning("Wrong image dimensions: must be " + str(self.width) + "x" + str(self.height))
             # return a blank buffer
             return [0x00] * (int(self.width/8) * self.height)
 
+        # Mode '1' rows are already packed MSB-first, 8 pixels per byte (no copy needed)
+        if img.mode != '1':
+            img = img.convert('1')
         buf = bytearray(img.tobytes('raw'))
         return buf
 
     def display(self, image):
-        self.send_command(0x24)
-        self.send_data2(image)
+        self._cleared_color = None
+        self.send_command_data(0x24, image)
         self.TurnOnDisplay()
 
     def display_fast(self, image):
-        self.send_command(0x24)
-        self.send_data2(image)
+        self._cleared_color = None
+        self.send_command_data(0x24, image)
         self.TurnOnDisplay_Fast()
 
     def displayPartial(self, image):
+        self.displayPartialWindow(image, 0, self.height - 1)
+
+    def displayPartialWindow(self, image, y_start, y_end):
+        # image holds only the rows y_start..y_end; RAM outside the window keeps the last frame
+        self._cleared_color = None
         epdconfig.digital_write(self.reset_pin, 0)
         epdconfig.delay_ms(1)
         epdconfig.digital_write(self.reset_pin, 1)
 
-        self.send_command(0x3C) # BorderWavefrom
-        self.send_data(0x80)
+        self.send_command_data(0x3C, b'\x80') # BorderWavefrom
 
-        self.send_command(0x01) # Driver output control
-        self.send_data(0xF9)
-        self.send_data(0x00)
-        self.send_data(0x00)
+        self.send_command_data(0x01, b'\xf9\x00\x00') # Driver output control
 
-        self.send_command(0x11) # data entry mode
-        self.send_data(0x03)
+        self.send_command_data(0x11, b'\x03') # data entry mode
 
-        self.SetWindow(0, 0, self.width - 1, self.height - 1)
-        self.SetCursor(0, 0)
+        self.SetWindow(0, y_start, self.width - 1, y_end)
+        self.SetCursor(0, y_start)
 
-        self.send_command(0x24) # WRITE_RAM
-        self.send_data2(image)
+        self.send_command_data(0x24, image) # WRITE_RAM
         self.TurnOnDisplayPart()
 
     def displayPartBaseImage(self, image):
-        self.send_command(0x24)
-        self.send_data2(image)
-
-        self.send_command(0x26)
-        self.send_data2(image)
+        self._cleared_color = None
+        self.send_command_data(0x24, image)
+        self.send_command_data(0x26, image)
         self.TurnOnDisplay()
 
-    def Clear(self, color=0xFF):
-        if self.width%8 == 0:
-            linewidth = int(self.width/8)
-        else:
-            linewidth = int(self.width/8) + 1
-
-        self.send_command(0x24)
-        self.send_data2([color] * int(self.height * linewidth))
+    def Clear(self, color=0xFF, force=False):
+        # Refreshing to the fill the panel already shows changes nothing
+        if color == self._cleared_color and not force:
+            return
+        self.send_command_data(0x24, _solid_plane(color))
         self.TurnOnDisplay()
+        self._cleared_color = color
 
     def sleep(self):
-        self.send_command(0x10) #enter deep sleep
-        self.send_data(0x01)
+        self.send_command_data(0x10, b'\x01') #enter deep sleep
 
         epdconfig.delay_ms(2000)
         epdconfig.module_exit()
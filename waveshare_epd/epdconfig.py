@@ -6,6 +6,7 @@ Based on official Waveshare implementation
 import os
 import logging
 import sys
+import threading
 import time
 
 # Pin definition
@@ -17,18 +18,66 @@ BUSY_PIN        = 24
 # SPI device
 SPI_DEVICE      = 0
 
+# SPI clock (Waveshare default); DisplayManager raises it only when fast_spi is enabled
+SPI_SPEED_HZ    = 4000000
+
 logger = logging.getLogger(__name__)
 
+# Open SPI device and the active GPIO backend's release function; both stay set from
+# module_init until module_exit, so repeated inits reuse them instead of claiming again
+spi = None
+_gpio_exit = None
+
+def _not_initialized(*args, **kwargs):
+    raise RuntimeError("epdconfig.module_init() must succeed before the panel is driven")
+
+# GPIO and SPI entry points; module_init binds the real ones and module_exit restores these
+digital_write = digital_read = wait_for_low = _not_initialized
+spi_writebyte = spi_writebyte2 = _not_initialized
+
 def module_init():
-    global spi, GPIO
+    global spi, spi_writebyte, spi_writebyte2
     try:
         import spidev
-        import RPi.GPIO as GPIO
     except ImportError:
-        logger.error("This library requires the spidev and RPi.GPIO libraries")
-        logger.error("Install with: sudo apt install python3-spidev python3-rpi.gpio")
+        logger.error("This library requires the spidev library")
+        logger.error("Install with: sudo apt install python3-spidev")
         return -1
 
+    if _gpio_exit is None:
+        # Prefer lgpio (kernel GPIO chardev, thin C calls); fall back to RPi.GPIO
+        try:
+            import lgpio
+        except ImportError:
+            lgpio = None
+        if lgpio is not None:
+            try:
+                _lgpio_init(lgpio)
+            except Exception as e:
+                logger.warning("lgpio setup failed (%s), falling back to RPi.GPIO", e)
+    if _gpio_exit is None:
+        try:
+            import RPi.GPIO as GPIO
+        except ImportError:
+            logger.error("This library requires the lgpio or RPi.GPIO library")
+            logger.error("Install with: sudo apt install python3-lgpio")
+            return -1
+        _rpi_gpio_init(GPIO)
+
+    # SPI device, bus = 0, device = 0
+    if spi is None:
+        spi = spidev.SpiDev()
+        spi.open(0, 0)
+    spi.max_speed_hz = SPI_SPEED_HZ
+    spi.mode = 0b00
+    # Bind the transfer methods directly; writebytes2 takes any buffer (bytes, bytearray,
+    # numpy) of any length in one call
+    spi_writebyte = spi.writebytes
+    spi_writebyte2 = spi.writebytes2
+    return 0
+
+def _rpi_gpio_init(GPIO):
+    global digital_write, digital_read, wait_for_low, _gpio_exit
     GPIO.setmode(GPIO.BCM)
     GPIO.setwarnings(False)
     GPIO.setup(RST_PIN, GPIO.OUT)
@@ -36,33 +85,75 @@ def module_init():
     GPIO.setup(CS_PIN, GPIO.OUT)
     GPIO.setup(BUSY_PIN, GPIO.IN)
 
-    # SPI device, bus = 0, device = 0
-    spi = spidev.SpiDev()
-    spi.open(0, 0)
-    spi.max_speed_hz = 4000000
-    spi.mode = 0b00
-    return 0
+    def wait_for_low(pin, poll_ms=10):
+        # Sleep until the falling edge; the timeout re-checks the level in case the edge was missed
+        while GPIO.input(pin) == 1:
+            GPIO.wait_for_edge(pin, GPIO.FALLING, timeout=poll_ms)
+
+    def _gpio_exit():
+        GPIO.output(RST_PIN, 0)
+        GPIO.output(DC_PIN, 0)
+        GPIO.cleanup()
+
+    digital_write = GPIO.output
+    digital_read = GPIO.input
+
+def _lgpio_init(lgpio):
+    global digital_write, digital_read, wait_for_low, _gpio_exit
+    chip = lgpio.gpiochip_open(0)
+    # CS is driven in software like the RPi.GPIO backend does
+    claimed = []
+    try:
+        for pin in (RST_PIN, DC_PIN, CS_PIN):
+            lgpio.gpio_claim_output(chip, pin)
+            claimed.append(pin)
+        lgpio.gpio_claim_alert(chip, BUSY_PIN, lgpio.FALLING_EDGE)
+        claimed.append(BUSY_PIN)
+        # One callback per claim; _gpio_exit cancels it before the lines are freed
+        released = threading.Event()
+        busy_callback = lgpio.callback(chip, BUSY_PIN, lgpio.FALLING_EDGE,
+                                       lambda chip, gpio, level, tick: released.set())
+    except Exception:
+        # A line was busy or the callback failed: release what was claimed and the chip
+        for pin in claimed:
+            lgpio.gpio_free(chip, pin)
+        lgpio.gpiochip_close(chip)
+        raise
+
+    def digital_write(pin, value):
+        lgpio.gpio_write(chip, pin, value)
+
+    def digital_read(pin):
+        return lgpio.gpio_read(chip, pin)
+
+    def wait_for_low(pin, poll_ms=10):
+        # The alert callback sets the event on the falling edge; the timeout re-checks the level
+        released.clear()
+        while lgpio.gpio_read(chip, pin) == 1:
+            released.wait(poll_ms / 1000.0)
+            released.clear()
+
+    def _gpio_exit():
+        busy_callback.cancel()
+        lgpio.gpio_write(chip, RST_PIN, 0)
+        lgpio.gpio_write(chip, DC_PIN, 0)
+        for pin in (RST_PIN, DC_PIN, CS_PIN, BUSY_PIN):
+            lgpio.gpio_free(chip, pin)
+        lgpio.gpiochip_close(chip)
 
 def module_exit():
+    global spi, _gpio_exit, digital_write, digital_read, wait_for_low, spi_writebyte, spi_writebyte2
     logger.debug("spi end")
-    spi.close()
+    if spi is not None:
+        spi.close()
+        spi = None
 
     logger.debug("close 5V, Module enters 0 power consumption ...")
-    GPIO.output(RST_PIN, 0)
-    GPIO.output(DC_PIN, 0)
-    GPIO.cleanup()
-
-def digital_write(pin, value):
-    GPIO.output(pin, value)
-
-def digital_read(pin):
-    return GPIO.input(pin)
+    if _gpio_exit is not None:
+        _gpio_exit()
+        _gpio_exit = None
+    digital_write = digital_read = wait_for_low = _not_initialized
+    spi_writebyte = spi_writebyte2 = _not_initialized
 
 def delay_ms(delaytime):
     time.sleep(delaytime / 1000.0)
-
-def spi_writebyte(data):
-    spi.writebytes(data)
-
-def spi_writebyte2(data):
-    spi.writebytes(data)
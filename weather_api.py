@@ -6,10 +6,89 @@ Handles fetching weather data from Open-Meteo API
 
 import requests
 import logging
-from datetime import datetime
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson parses the response bytes directly (and faster); stdlib json accepts bytes too
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 logger = logging.getLogger(__name__)
 
+# German descriptions of the WMO weather interpretation codes
+_WMO_DESCRIPTIONS = MappingProxyType({
+    0: "Klarer Himmel",
+    1: "Überwiegend klar",
+    2: "Teilweise bewölkt",
+    3: "Bedeckt",
+    45: "Nebel",
+    48: "Nebel mit Reifablagerung",
+    51: "Leichter Sprühregen",
+    53: "Mäßiger Sprühregen",
+    55: "Dichter Sprühregen",
+    56: "Leichter gefrierender Sprühregen",
+    57: "Dichter gefrierender Sprühregen",
+    61: "Leichter Regen",
+    63: "Mäßiger Regen",
+    65: "Starker Regen",
+    66: "Leichter gefrierender Regen",
+    67: "Starker gefrierender Regen",
+    71: "Leichter Schneefall",
+    73: "Mäßiger Schneefall",
+    75: "Starker Schneefall",
+    77: "Schneekörner",
+    80: "Leichte Regenschauer",
+    81: "Mäßige Regenschauer",
+    82: "Starke Regenschauer",
+    85: "Leichte Schneeschauer",
+    86: "Starke Schneeschauer",
+    95: "Gewitter",
+    96: "Gewitter mit leichtem Hagel",
+    99: "Gewitter mit starkem Hagel"
+})
+
+# Current variables read by get_weather_data, sent as one comma-separated value
+_CURRENT_FIELDS = ','.join([
+    'temperature_2m',
+    'relative_humidity_2m',
+    'apparent_temperature',
+    'is_day',
+    'weather_code',
+    'surface_pressure',
+    'wind_speed_10m',
+    'wind_direction_10m'
+])
+
+# WeatherReading fields copied straight from Open-Meteo 'current' variables (0 when missing)
+_READING_KEYS = ('temperature', 'feels_like', 'humidity', 'pressure',
+                 'wind_speed', 'wind_direction', 'weather_code')
+_READING_SOURCES = ('temperature_2m', 'apparent_temperature', 'relative_humidity_2m', 'surface_pressure',
+                    'wind_speed_10m', 'wind_direction_10m', 'weather_code')
+_READING_DEFAULTS = (0,) * len(_READING_KEYS)
+
+@dataclass(frozen=True)  # slots=True would need Python 3.10; the station supports 3.8+
+class WeatherReading:
+    """One weather observation; equal (and equally hashed) when everything but the fetch time matches"""
+    city: str
+    country: str
+    temperature: float
+    feels_like: float
+    humidity: float
+    pressure: float
+    wind_speed: float
+    wind_direction: float
+    weather_code: int
+    is_day: bool
+    description: str
+    visibility: float = 10.0  # Default visibility
+    timestamp: float = field(default_factory=time.time, compare=False)  # Fetch time (epoch seconds)
+
+
 class WeatherAPI:
     def __init__(self, latitude=54.3233, longitude=13.0814):
         """
@@ -20,122 +99,155 @@ class WeatherAPI:
         self.longitude = longitude
         self.base_url = "https://api.open-meteo.com/v1/forecast"
         
+        # One keep-alive connection reused across polls (no TLS handshake per fetch),
+        # with transient connection failures retried
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': 'weather-station/1.0',
+                                     'Accept-Encoding': 'gzip, deflate'})  # Compressed JSON on the wire
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=2,
+                              max_retries=Retry(total=3, backoff_factor=0.5))
+        self.session.mount('https://', adapter)
+        
+        # Last good response, reused until it expires and revalidated with a conditional request
+        self._clear_cache()
+        
+        # Consecutive failed fetches; the API is left alone until _retry_at (monotonic seconds)
+        self._fail_count = 0
+        self._retry_at = 0.0
+        
     def get_weather_data(self):
         """
         Fetch current weather data from Open-Meteo API
-        Returns dictionary with weather information
+        Returns a WeatherReading
         """
+        # The server said the last response is still fresh
+        now = time.monotonic()
+        if self._cached_data is not None and now < self._cache_expires:
+            logger.debug("Using cached weather data")
+            return self._cached_data
+        
+        # Backing off after failures: don't spend another timeout on an unreachable API
+        if now < self._retry_at:
+            return self._get_last_known_data()
+        
         try:
             # API parameters for current weather
             params = {
                 'latitude': self.latitude,
                 'longitude': self.longitude,
-                'current': [
-                    'temperature_2m',
-                    'relative_humidity_2m',
-                    'apparent_temperature',
-                    'is_day',
-                    'precipitation',
-                    'weather_code',
-                    'surface_pressure',
-                    'wind_speed_10m',
-                    'wind_direction_10m'
-                ],
+                'current': _CURRENT_FIELDS,
                 'timezone': 'Europe/Berlin',
                 'forecast_days': 1
             }
             
-            logger.info(f"Fetching weather data for coordinates: {self.latitude}, {self.longitude}")
-            response = requests.get(self.base_url, params=params, timeout=10)
+            logger.info("Fetching weather data for coordinates: %s, %s", self.latitude, self.longitude)
+            headers = {}
+            if self._cached_data is not None:
+                if self._etag:
+                    headers['If-None-Match'] = self._etag
+                if self._last_modified:
+                    headers['If-Modified-Since'] = self._last_modified
+            response = self.session.get(self.base_url, params=params, headers=headers, timeout=10)
+            
+            if response.status_code == 304 and self._cached_data is not None:
+                logger.info("Weather data not modified since last fetch")
+                self._cache_expires = time.monotonic() + self._max_age(response)
+                return self._cached_data
             response.raise_for_status()
+            logger.debug("Weather response: %d bytes decoded, Content-Encoding %s",
+                         len(response.content), response.headers.get('Content-Encoding', 'identity'))
             
-            data = response.json()
+            data = json_loads(response.content)
             current = data.get('current', {})
             
             # Extract weather information
-            weather_data = {
-                'city': 'Stralsund',  # Default city name
-                'country': 'DE',
-                'temperature': current.get('temperature_2m', 0),
-                'feels_like': current.get('apparent_temperature', 0),
-                'humidity': current.get('relative_humidity_2m', 0),
-                'pressure': current.get('surface_pressure', 0),
-                'wind_speed': current.get('wind_speed_10m', 0),
-                'wind_direction': current.get('wind_direction_10m', 0),
-                'weather_code': current.get('weather_code', 0),
-                'is_day': current.get('is_day', 1) == 1,
-                'description': self._get_weather_description(current.get('weather_code', 0)),
-                'visibility': 10.0,  # Default visibility
-                'timestamp': datetime.now().isoformat()
-            }
+            readings = dict(zip(_READING_KEYS, map(current.get, _READING_SOURCES, _READING_DEFAULTS)))
+            weather_data = WeatherReading(
+                city='Stralsund',  # Default city name
+                country='DE',
+                is_day=current.get('is_day', 1) == 1,
+                description=self._get_weather_description(readings['weather_code']),
+                **readings
+            )
             
-            logger.info(f"Weather data retrieved successfully: {weather_data['temperature']:.1f}°C, {weather_data['description']}")
+            logger.info("Weather data retrieved successfully: %.1f°C, %s", weather_data.temperature, weather_data.description)
+            self._cached_data = weather_data
+            self._etag = response.headers.get('ETag')
+            self._last_modified = response.headers.get('Last-Modified')
+            self._cache_expires = time.monotonic() + self._max_age(response)
+            self._fail_count = 0
             return weather_data
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching weather data: {e}")
-            return self._get_fallback_data()
+            logger.error("Error fetching weather data: %s", e)
         except Exception as e:
-            logger.error(f"Unexpected error in weather API: {e}")
-            return self._get_fallback_data()
+            logger.error("Unexpected error in weather API: %s", e)
+        
+        # Exponential backoff: 2, 4, 8 ... minutes between attempts, at most one hour
+        self._fail_count += 1
+        backoff = min(60 * 2 ** self._fail_count, 3600)
+        self._retry_at = time.monotonic() + backoff
+        logger.warning("Next weather fetch attempt in %d s", backoff)
+        return self._get_last_known_data()
+    
+    def _get_last_known_data(self):
+        """Last successfully fetched data while the API is unavailable, else the fallback"""
+        if self._cached_data is not None:
+            logger.warning("Using last known weather data")
+            return self._cached_data
+        return self._get_fallback_data()
+    
+    def _clear_cache(self):
+        """Forget the cached response (e.g. after the location changed)"""
+        self._cached_data = None
+        self._etag = None
+        self._last_modified = None
+        self._cache_expires = 0.0
+    
+    @staticmethod
+    def _max_age(response):
+        """Seconds a response may be reused without asking the server, from Cache-Control"""
+        for directive in response.headers.get('Cache-Control', '').split(','):
+            name, _, value = directive.strip().partition('=')
+            name = name.lower()
+            if name in ('no-cache', 'no-store'):
+                return 0
+            if name == 'max-age':
+                try:
+                    return max(0, int(value.strip('"')))
+                except ValueError:
+                    return 0
+        return 0
     
     def _get_weather_description(self, weather_code):
         """
         Convert weather code to German description
         Based on WMO Weather interpretation codes
         """
-        descriptions = {
-            0: "Klarer Himmel",
-            1: "Überwiegend klar",
-            2: "Teilweise bewölkt",
-            3: "Bedeckt",
-            45: "Nebel",
-            48: "Nebel mit Reifablagerung",
-            51: "Leichter Sprühregen",
-            53: "Mäßiger Sprühregen",
-            55: "Dichter Sprühregen",
-            56: "Leichter gefrierender Sprühregen",
-            57: "Dichter gefrierender Sprühregen",
-            61: "Leichter Regen",
-            63: "Mäßiger Regen",
-            65: "Starker Regen",
-            66: "Leichter gefrierender Regen",
-            67: "Starker gefrierender Regen",
-            71: "Leichter Schneefall",
-            73: "Mäßiger Schneefall",
-            75: "Starker Schneefall",
-            77: "Schneekörner",
-            80: "Leichte Regenschauer",
-            81: "Mäßige Regenschauer",
-            82: "Starke Regenschauer",
-            85: "Leichte Schneeschauer",
-            86: "Starke Schneeschauer",
-            95: "Gewitter",
-            96: "Gewitter mit leichtem Hagel",
-            99: "Gewitter mit starkem Hagel"
-        }
-        return descriptions.get(weather_code, "Unbekannt")
+        return _WMO_DESCRIPTIONS.get(weather_code, "Unbekannt")
     
     def _get_fallback_data(self):
         """
         Return fallback weather data when API is unavailable
         """
         logger.warning("Using fallback weather data")
-        return {
-            'city': 'Stralsund',
-            'country': 'DE',
-            'temperature': 20.0,
-            'feels_like': 19.0,
-            'humidity': 65,
-            'pressure': 1013.25,
-            'wind_speed': 5.0,
-            'wind_direction': 180,
-            'weather_code': 1,
-            'is_day': True,
-            'description': 'Überwiegend klar',
-            'visibility': 10.0,
-            'timestamp': datetime.now().isoformat()
-        }
+        return WeatherReading(
+            city='Stralsund',
+            country='DE',
+            temperature=20.0,
+            feels_like=19.0,
+            humidity=65,
+            pressure=1013.25,
+            wind_speed=5.0,
+            wind_direction=180,
+            weather_code=1,
+            is_day=True,
+            description='Überwiegend klar'
+        )
+    
+    def close(self):
+        """Close the pooled HTTP connection"""
+        self.session.close()
     
     def set_location(self, latitude, longitude, city_name=None):
         """
@@ -143,9 +255,10 @@ class WeatherAPI:
         """
         self.latitude = latitude
         self.longitude = longitude
+        self._clear_cache()
         if city_name:
             self.city_name = city_name
-        logger.info(f"Location updated to: {latitude}, {longitude}")
+        logger.info("Location updated to: %s, %s", latitude, longitude)
 
 # Example usage
 if __name__ == "__main__":
@@ -154,12 +267,12 @@ if __name__ == "__main__":
     weather = api.get_weather_data()
     
     print("Weather Data:")
-    print(f"  City: {weather['city']}")
-    print(f"  Temperature: {weather['temperature']:.1f}°C")
-    print(f"  Feels like: {weather['feels_like']:.1f}°C")
-    print(f"  Humidity: {weather['humidity']}%")
-    print(f"  Pressure: {weather['pressure']:.1f} hPa")
-    print(f"  Wind: {weather['wind_speed']:.1f} m/s @ {weather['wind_direction']}°")
-    print(f"  Description: {weather['description']}")
-    print(f"  Weather Code: {weather['weather_code']}")
-    print(f"  Is Day: {weather['is_day']}")
+    print(f"  City: {weather.city}")
+    print(f"  Temperature: {weather.temperature:.1f}°C")
+    print(f"  Feels like: {weather.feels_like:.1f}°C")
+    print(f"  Humidity: {weather.humidity}%")
+    print(f"  Pressure: {weather.pressure:.1f} hPa")
+    print(f"  Wind: {weather.wind_speed:.1f} m/s @ {weather.wind_direction}°")
+    print(f"  Description: {weather.description}")
+    print(f"  Weather Code: {weather.weather_code}")
+    print(f"  Is Day: {weather.is_day}")
@@ -6,7 +6,10 @@ Displays current weather data fetched from Open-Meteo API
 
 import time
 import logging
-from datetime import datetime
+import logging.handlers
+import queue
+import signal
+import threading
 from weather_api import WeatherAPI
 from display_manager import DisplayManager
 from config import Config
@@ -16,7 +19,8 @@ logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('weather_station.log'),
+        # Bounded log on the SD card: 1 MB plus two rotated copies
+        logging.handlers.RotatingFileHandler('weather_station.log', maxBytes=1_000_000, backupCount=2),
         logging.StreamHandler()
     ]
 )
@@ -27,51 +31,92 @@ class WeatherStation:
         """Initialize the weather station"""
         self.config = Config()
         self.weather_api = WeatherAPI(self.config.latitude, self.config.longitude)
-        self.display = DisplayManager()
+        self.display = DisplayManager(fast_spi=self.config.fast_spi)
+        
+        # Fetches run on their own thread; the 1-slot queue hands the newest result to the main loop
+        self._weather_queue = queue.Queue(maxsize=1)
+        self._stop = threading.Event()
+        self._fetch_thread = threading.Thread(target=self._fetch_loop, name='weather-fetch', daemon=True)
+        self._fetch_thread.start()
         logger.info("Weather Station initialized")
     
-    def update_display(self):
-        """Fetch weather data and update the display"""
+    def _fetch_loop(self):
+        """Fetch weather data every update interval and publish it to the main loop"""
+        # Deadlines advance by whole intervals, so fetch time does not make updates drift
+        next_fetch = time.monotonic()
+        while not self._stop.is_set():
+            try:
+                weather_data = self.weather_api.get_weather_data()
+            except Exception as e:
+                logger.error("Error fetching weather data: %s", e)
+                self._stop.wait(60)  # Wait 1 minute before retrying
+                continue
+            
+            # Latest wins: replace a result the main loop has not picked up yet
+            try:
+                self._weather_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._weather_queue.put_nowait(weather_data)
+            
+            # Wait for the specified update interval (returns at once on shutdown)
+            interval = self.config.update_interval * 60  # Convert minutes to seconds
+            next_fetch += interval
+            now = time.monotonic()
+            if next_fetch < now:
+                next_fetch = now  # Fell behind (e.g. long outage): restart the schedule
+            self._stop.wait(next_fetch - now)
+    
+    def update_display(self, weather_data):
+        """Update the display with freshly fetched weather data"""
         try:
-            # Fetch current weather data
-            weather_data = self.weather_api.get_weather_data()
             if weather_data:
                 # Update the display with new data
                 self.display.show_weather(weather_data)
-                logger.info(f"Display updated successfully at {datetime.now()}")
+                logger.info("Display updated successfully")  # The record time is in the log format
                 return True
             else:
                 logger.error("Failed to fetch weather data")
                 return False
         except Exception as e:
-            logger.error(f"Error updating display: {e}")
+            logger.error("Error updating display: %s", e)
             return False
     
+    def _handle_sigterm(self, signum, frame):
+        """Ask the main loop to shut down cleanly when the service is stopped"""
+        self._stop.set()
+        try:
+            self._weather_queue.put_nowait(None)  # Wake-up sentinel for a main loop blocked in get()
+        except queue.Full:
+            pass  # A pending result wakes the main loop just as well
+    
     def run(self):
         """Main loop for the weather station"""
         logger.info("Starting weather station main loop")
+        signal.signal(signal.SIGTERM, self._handle_sigterm)
         
-        # Initial display update
-        self.update_display()
-        
-        while True:
+        while not self._stop.is_set():
             try:
-                # Wait for the specified update interval
-                time.sleep(self.config.update_interval * 60)  # Convert minutes to seconds
-                
-                # Update the display
-                self.update_display()
+                # Wait for the fetch thread's next result, then update the display
+                weather_data = self._weather_queue.get()
+                if self._stop.is_set():
+                    break
+                self.update_display(weather_data)
                 
             except KeyboardInterrupt:
-                logger.info("Weather station stopped by user")
                 break
             except Exception as e:
-                logger.error(f"Unexpected error in main loop: {e}")
-                time.sleep(60)  # Wait 1 minute before retrying
+                logger.error("Unexpected error in main loop: %s", e)
+                self._stop.wait(60)  # Wait 1 minute before retrying (returns at once on shutdown)
+        
+        logger.info("Weather station stopped")
+        self._stop.set()
+        self.config.flush()
+        self.weather_api.close()
 
 if __name__ == "__main__":
     try:
         station = WeatherStation()
         station.run()
     except Exception as e:
-        logger.error(f"Failed to start weather station: {e}")
+        logger.error("Failed to start weather station: %s", e)